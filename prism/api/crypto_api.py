@@ -6,6 +6,7 @@ Fetches real-time cryptocurrency prices from CoinGecko API.
 import asyncio
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from ..utils.logger import get_logger, log_exception, log_performance
@@ -107,6 +108,12 @@ class CryptoAPI:
         self._cache_duration = timedelta(minutes=5)  # Cache for 5 minutes
         self._max_retries = 3  # Maximum number of retries for rate limiting
         self._retry_delay = 2  # Initial delay in seconds
+
+        # Keep-alive connections reused by every synchronous request; retries
+        # are handled by _retry_request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount("https://", adapter)
         logger.info("CryptoAPI initialized with timeout=%s", timeout)
 
     def _retry_request(
@@ -133,7 +140,7 @@ class CryptoAPI:
 
         for attempt in range(self._max_retries + 1):
             try:
-                response = requests.request(
+                response = self._session.request(
                     method, url, params=params, timeout=self.timeout
                 )
                 if response.status_code == 429:  # Rate limited
@@ -176,12 +183,13 @@ class CryptoAPI:
         ticker_upper = ticker.upper()
         return self.TICKER_TO_ID.get(ticker_upper, ticker.lower())
 
-    def _is_cache_valid(self, ticker: str) -> bool:
+    def _is_cache_valid(self, ticker: str, currency: str) -> bool:
         """
         Check if cached price is still valid.
 
         Args:
             ticker: Cryptocurrency ticker
+            currency: Currency the price is needed in
 
         Returns:
             bool: True if cache is valid
@@ -189,6 +197,9 @@ class CryptoAPI:
         if ticker not in self._cache or ticker not in self._cache_timestamp:
             return False
 
+        if currency not in self._cache[ticker]:
+            return False
+
         age = datetime.now() - self._cache_timestamp[ticker]
         return age < self._cache_duration
 
@@ -213,7 +224,7 @@ class CryptoAPI:
         )
 
         # Check cache first
-        if use_cache and self._is_cache_valid(ticker):
+        if use_cache and self._is_cache_valid(ticker, currency):
             cached_data = self._cache.get(ticker, {})
             price = cached_data.get(currency)
             logger.debug(f"Returning cached price for {ticker}: {price}")
@@ -278,7 +289,7 @@ class CryptoAPI:
         # Check cache first
         if use_cache:
             for ticker in tickers:
-                if self._is_cache_valid(ticker):
+                if self._is_cache_valid(ticker, currency):
                     cached_data = self._cache.get(ticker, {})
                     results[ticker] = cached_data.get(currency)
                 else:
@@ -343,7 +354,7 @@ class CryptoAPI:
         logger.debug(f"Async fetching price for {ticker} in {currency}")
 
         # Check cache first
-        if use_cache and self._is_cache_valid(ticker):
+        if use_cache and self._is_cache_valid(ticker, currency):
             cached_data = self._cache.get(ticker, {})
             price = cached_data.get(currency)
             logger.debug(f"Returning cached price for {ticker}: {price}")
@@ -416,7 +427,7 @@ class CryptoAPI:
         # Check cache first
         if use_cache:
             for ticker in tickers:
-                if self._is_cache_valid(ticker):
+                if self._is_cache_valid(ticker, currency):
                     cached_data = self._cache.get(ticker, {})
                     results[ticker] = cached_data.get(currency)
                 else:
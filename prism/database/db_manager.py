@@ -5,7 +5,7 @@ Provides CRUD operations for transactions, assets, and orders.
 
 import sqlite3
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Set, Tuple
 from datetime import datetime, date
 
 from .schema import get_database_path
@@ -84,6 +84,18 @@ class DatabaseManager:
             logger.error(f"Failed to connect to database: {e}")
             raise
 
+    def open_connection(self) -> sqlite3.Connection:
+        """
+        Open a new connection owned by the caller.
+
+        SQLite connections are bound to the thread that created them, so
+        worker threads use this instead of the shared conn property.
+
+        Returns:
+            sqlite3.Connection: Database connection, to be closed by the caller
+        """
+        return self._get_connection()
+
     # ==================== TRANSACTIONS ====================
 
     @log_exception
@@ -139,6 +151,67 @@ class DatabaseManager:
         logger.info(f"Transaction added successfully with ID: {transaction_id}")
         return transaction_id
 
+    @log_exception
+    @log_performance("add_transactions_bulk")
+    def add_transactions_bulk(
+        self, rows: List[Tuple[str, float, str, str, Optional[str]]]
+    ) -> int:
+        """
+        Add several transactions in one transaction.
+
+        Args:
+            rows: A list of (date, amount, category, transaction_type,
+                description) tuples
+
+        Returns:
+            int: Number of transactions added
+
+        Raises:
+            ValueError: If a row's transaction_type is not valid; no row is added
+        """
+        if not rows:
+            return 0
+
+        for row in rows:
+            if row[3] not in ("personal", "investment"):
+                logger.error(f"Invalid transaction_type: {row[3]}")
+                raise ValueError("transaction_type must be 'personal' or 'investment'")
+
+        logger.debug(f"Adding {len(rows)} transactions")
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.executemany(
+            """
+            INSERT INTO transactions (date, amount, category, type, description)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+        conn.commit()
+        conn.close()
+
+        logger.info(f"{len(rows)} transactions added successfully")
+        return len(rows)
+
+    def get_transaction_keys(self) -> Set[Tuple[str, float, str]]:
+        """
+        Get the duplicate-detection key of every transaction in one query.
+
+        Returns:
+            Set of (date, amount rounded to cents, category) tuples
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT date, amount, category FROM transactions")
+        keys = {(date, round(amount, 2), category) for date, amount, category in cursor}
+        conn.close()
+
+        return keys
+
     def get_transaction(self, transaction_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a transaction by ID.
@@ -497,6 +570,7 @@ class DatabaseManager:
         asset_type: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        order_by_value: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         Get all assets with optional type filter and pagination.
@@ -505,6 +579,8 @@ class DatabaseManager:
             asset_type: Filter by type ("crypto", "stock", or "bond")
             limit: Maximum number of records to return
             offset: Number of records to skip
+            order_by_value: Order by current value (highest first) instead
+                of by ticker
 
         Returns:
             List[Dict]: List of asset dictionaries
@@ -519,7 +595,10 @@ class DatabaseManager:
             query += " AND asset_type = ?"
             params.append(asset_type)
 
-        query += " ORDER BY ticker"
+        if order_by_value:
+            query += " ORDER BY quantity * COALESCE(current_price, 0) DESC, ticker"
+        else:
+            query += " ORDER BY ticker"
 
         if limit is not None:
             query += " LIMIT ?"
@@ -647,6 +726,33 @@ class DatabaseManager:
 
         return success
 
+    def update_asset_prices(self, prices: List[Tuple[int, float]]) -> int:
+        """
+        Update the current price of several assets in one transaction.
+
+        Args:
+            prices: A list of (asset_id, current_price) tuples
+
+        Returns:
+            int: Number of assets updated
+        """
+        if not prices:
+            return 0
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.executemany(
+            "UPDATE assets SET current_price = ? WHERE id = ?",
+            [(price, asset_id) for asset_id, price in prices],
+        )
+
+        conn.commit()
+        updated = cursor.rowcount
+        conn.close()
+
+        return updated
+
     def update_asset_ticker(self, asset_id: int, new_ticker: str) -> bool:
         """
         Update the ticker of an asset.
@@ -769,6 +875,41 @@ class DatabaseManager:
             "allocation": allocation,
         }
 
+    @log_exception
+    @log_performance("get_portfolio_snapshot")
+    def get_portfolio_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the portfolio totals shown on the investments tab in one query.
+
+        Returns:
+            Dict: total_value, total_cost, total_gain and asset_count
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT
+                SUM(quantity * COALESCE(current_price, price_buy)) as total_value,
+                SUM(quantity * price_buy) as total_cost,
+                COUNT(*) as asset_count
+            FROM assets
+            """
+        )
+
+        row = cursor.fetchone()
+        conn.close()
+
+        total_value = row["total_value"] or 0.0
+        total_cost = row["total_cost"] or 0.0
+
+        return {
+            "total_value": total_value,
+            "total_cost": total_cost,
+            "total_gain": total_value - total_cost,
+            "asset_count": row["asset_count"],
+        }
+
     def get_asset_performance(self, asset_id: int) -> Dict[str, Any]:
         """
         Calculate performance metrics for an asset.
@@ -810,12 +951,26 @@ class DatabaseManager:
             prices: A list of (date, price) tuples
         """
         logger.debug(f"Adding {len(prices)} historical prices for asset {asset_id}")
+        self.add_historical_prices_bulk(
+            [(asset_id, date, price) for date, price in prices]
+        )
+
+    def add_historical_prices_bulk(self, rows: List[Tuple[int, str, float]]):
+        """
+        Add historical prices for several assets in one transaction.
+
+        Args:
+            rows: A list of (asset_id, date, price) tuples
+        """
+        if not rows:
+            return
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.executemany(
             "INSERT OR REPLACE INTO historical_prices (asset_id, date, price) VALUES (?, ?, ?)",
-            [(asset_id, date, price) for date, price in prices],
+            rows,
         )
 
         conn.commit()
@@ -883,6 +1038,35 @@ class DatabaseManager:
 
         return row[0] if row and row[0] else None
 
+    @log_exception
+    def get_last_historical_price_dates(self, asset_ids: List[int]) -> Dict[int, str]:
+        """
+        Get the last historical price date of several assets in one query.
+
+        Args:
+            asset_ids: IDs of the assets to look up
+
+        Returns:
+            Dictionary mapping asset ID to its most recent date; assets
+            without any historical price are left out
+        """
+        if not asset_ids:
+            return {}
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        placeholders = ",".join("?" * len(asset_ids))
+        cursor.execute(
+            f"SELECT asset_id, MAX(date) FROM historical_prices "
+            f"WHERE asset_id IN ({placeholders}) GROUP BY asset_id",
+            list(asset_ids),
+        )
+        rows = cursor.fetchall()
+        conn.close()
+
+        return {row[0]: row[1] for row in rows}
+
     # ==================== ORDERS ====================
 
     @log_exception
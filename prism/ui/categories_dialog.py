@@ -3,14 +3,19 @@ Categories and Budget Management Dialog for Prism application.
 Provides interface for managing custom categories, budgets, and viewing budget alerts.
 """
 
+import sqlite3
+import weakref
+from calendar import monthrange
+from datetime import date
+
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QHeaderView,
     QGroupBox,
     QLineEdit,
@@ -18,16 +23,449 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QWidget,
     QTabWidget,
-    QProgressBar,
     QTextEdit,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionProgressBar,
+    QStyle,
+    QApplication,
+)
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractTableModel,
+    QModelIndex,
+    QEvent,
+    QRect,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QPalette
 from ..utils.category_manager import CategoryManager
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Colors and stylesheets shared by every row, created once at import time
+_COLOR_GREEN = QColor("#10b981")
+_COLOR_RED = QColor("#dc2626")
+_COLOR_AMBER = QColor("#f59e0b")
+_COLOR_GRAY = QColor("#6b7280")
+_COLOR_WHITE = QColor("#ffffff")
+_COLOR_BLACK = QColor("#000000")
+
+# Colors offered for new categories, as (name, hex code) pairs
+_PALETTE = (
+    ("Red", "#ef4444"),
+    ("Green", "#10b981"),
+    ("Blue", "#3b82f6"),
+    ("Yellow", "#eab308"),
+    ("Purple", "#8b5cf6"),
+    ("Pink", "#ec4899"),
+    ("Teal", "#14b8a6"),
+    ("Orange", "#f59e0b"),
+    ("Gray", "#6b7280"),
+)
+
+# Static parts of the budget alerts HTML; only the data rows vary per call
+_ALERTS_EMPTY_HTML = (
+    "<div style='padding: 20px; text-align: center; color: #10b981;'>"
+    "<h2>✓ All Good!</h2>"
+    "<p>No budget alerts at this time. You're staying within your limits.</p>"
+    "</div>"
+)
+
+_ALERTS_HEADER_HTML = (
+    "<div style='padding: 10px;'>"
+    "<h2 style='color: #dc2626;'>⚠️ Budget Alerts</h2>"
+    "<p>The following categories have reached or exceeded 80% of their budget limits:</p>"
+    "<table style='width: 100%; border-collapse: collapse; margin-top: 10px;'>"
+    "<tr style='background-color: #f3f4f6; font-weight: bold;'>"
+    "<th style='padding: 8px; text-align: left;'>Category</th>"
+    "<th style='padding: 8px; text-align: right;'>Budget</th>"
+    "<th style='padding: 8px; text-align: right;'>Spent</th>"
+    "<th style='padding: 8px; text-align: right;'>Remaining</th>"
+    "<th style='padding: 8px; text-align: right;'>Usage</th>"
+    "</tr>"
+)
+
+_ALERTS_ROW_TMPL = (
+    "<tr style='background-color: {bg};'>"
+    "<td style='padding: 8px;'>{icon} {category}</td>"
+    "<td style='padding: 8px; text-align: right;'>€{budget_limit:,.2f}</td>"
+    "<td style='padding: 8px; text-align: right;'>€{spent:,.2f}</td>"
+    "<td style='padding: 8px; text-align: right;'>€{remaining:,.2f}</td>"
+    "<td style='padding: 8px; text-align: right; font-weight: bold;'>{usage_percent:.1f}%</td>"
+    "</tr>"
+)
+
+_ALERTS_FOOTER_HTML = "</table></div>"
+
+# Budget rows per database manager as (version, rows), kept across dialog opens
+_BUDGETS_CACHE = weakref.WeakKeyDictionary()
+
+# Per-category colors, parsed once per distinct hex code
+_COLOR_CACHE = {}
+
+
+def _cached_color(hex_code: str, default: QColor) -> QColor:
+    """
+    Get a QColor for a hex code, parsing each distinct code only once.
+
+    Args:
+        hex_code: Hex color string (e.g., '#10b981'), may be empty
+        default: Color returned when hex_code is empty
+
+    Returns:
+        Cached QColor instance
+    """
+    if not hex_code:
+        return default
+    color = _COLOR_CACHE.get(hex_code)
+    if color is None:
+        color = _COLOR_CACHE[hex_code] = QColor(hex_code)
+    return color
+
+
+class CategoriesModel(QAbstractTableModel):
+    """
+    Table model exposing categories lazily to a QTableView.
+
+    Rows are stored as parallel column lists, so data() does a single list
+    index per cell instead of dictionary lookups.
+    """
+
+    HEADERS = ["ID", "Icon", "Name", "Type", "Color", "In Use", "Actions"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._icons = []
+        self._names = []
+        self._types = []
+        self._colors = []
+        self._in_use = []
+
+    def set_categories(self, columns):
+        """
+        Replace the model contents.
+
+        Args:
+            columns: Category column lists from CategoryManager.get_category_columns,
+                including the 'in_use' column
+        """
+        self.beginResetModel()
+        self._ids = columns["id"]
+        self._icons = [icon or "" for icon in columns["icon"]]
+        self._names = columns["name"]
+        self._types = [category_type.title() for category_type in columns["type"]]
+        self._colors = [color or "" for color in columns["color"]]
+        self._in_use = columns["in_use"]
+        self.endResetModel()
+
+    def category_id(self, row: int) -> int:
+        """Return the category ID displayed at the given row."""
+        return self._ids[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return str(self._ids[row])
+            if column == 1:
+                return self._icons[row]
+            if column == 2:
+                return self._names[row]
+            if column == 3:
+                return self._types[row]
+            if column == 4:
+                return self._colors[row]
+            if column == 5:
+                return "Yes" if self._in_use[row] else "No"
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if column == 2:
+                return _cached_color(self._colors[row], _COLOR_BLACK)
+            if column == 5:
+                return _COLOR_GREEN if self._in_use[row] else _COLOR_GRAY
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            if column == 4:
+                return _cached_color(self._colors[row], _COLOR_WHITE)
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if column == 1:
+                return Qt.AlignmentFlag.AlignCenter
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if column == 6:
+                return "Delete category"
+
+        return None
+
+
+class BudgetModel(QAbstractTableModel):
+    """
+    Table model exposing monthly budget usage per expense category.
+
+    Rows are stored as parallel column lists, like CategoriesModel.
+    """
+
+    HEADERS = [
+        "Category",
+        "Budget Limit (€)",
+        "Spent This Month (€)",
+        "Remaining (€)",
+        "Usage %",
+        "Update",
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._labels = []
+        self._limits = []
+        self._spent = []
+
+    def set_budgets(self, ids, labels, limits, spent):
+        """
+        Replace the model contents.
+
+        Args:
+            ids: Category IDs
+            labels: Display labels ('icon name')
+            limits: Monthly budget limits (0 when not set)
+            spent: Amounts spent this month
+        """
+        self.beginResetModel()
+        self._ids = ids
+        self._labels = labels
+        self._limits = limits
+        self._spent = spent
+        self.endResetModel()
+
+    def budget(self, row: int) -> tuple:
+        """Return the (category ID, budget limit) displayed at the given row."""
+        return self._ids[row], self._limits[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+        budget_limit = self._limits[row]
+        spent = self._spent[row]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return self._labels[row]
+            if column == 1:
+                return f"{budget_limit:,.2f}" if budget_limit > 0 else "Not set"
+            if column == 2:
+                return f"{spent:,.2f}"
+            if column == 3:
+                return f"{budget_limit - spent:,.2f}" if budget_limit > 0 else "N/A"
+            if column == 4 and budget_limit <= 0:
+                return "N/A"
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if column == 3 and budget_limit > 0:
+                remaining = budget_limit - spent
+                return _COLOR_GREEN if remaining >= 0 else _COLOR_RED
+        elif role == Qt.ItemDataRole.UserRole:
+            if column == 4 and budget_limit > 0:
+                return spent / budget_limit * 100
+
+        return None
+
+
+class BudgetBarDelegate(QStyledItemDelegate):
+    """
+    Paints budget usage as a progress bar.
+
+    Reads the usage percentage from Qt.ItemDataRole.UserRole and draws it
+    with the current style, so no progress bar widget is kept per row.
+    Cells without a percentage fall back to the default text rendering.
+    """
+
+    MARGIN = 4
+
+    def paint(self, painter, option, index):
+        usage_pct = index.data(Qt.ItemDataRole.UserRole)
+        if usage_pct is None:
+            super().paint(painter, option, index)
+            return
+
+        # Color based on usage
+        if usage_pct >= 100:
+            chunk_color = _COLOR_RED
+        elif usage_pct >= 80:
+            chunk_color = _COLOR_AMBER
+        else:
+            chunk_color = _COLOR_GREEN
+
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(
+            self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN
+        )
+        bar.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = int(min(usage_pct, 100))
+        bar.text = f"{usage_pct:.1f}%"
+        bar.textVisible = True
+        bar.textAlignment = Qt.AlignmentFlag.AlignCenter
+        bar.palette = QPalette(option.palette)
+        bar.palette.setColor(QPalette.ColorRole.Highlight, chunk_color)
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter)
+
+
+class ActionDelegate(QStyledItemDelegate):
+    """
+    Paints a push button in each cell of a column and reports clicks by row.
+
+    A single instance serves the whole column, replacing one QWidget +
+    QHBoxLayout + QPushButton (and a lambda closure) per row.
+    """
+
+    MARGIN = 4
+
+    def __init__(self, text: str, on_click, button_width: int = 50, parent=None):
+        """
+        Initialize the delegate.
+
+        Args:
+            text: Button label
+            on_click: Callable invoked with the clicked row
+            button_width: Maximum button width in pixels
+            parent: Optional parent object
+        """
+        super().__init__(parent)
+        self._text = text
+        self._on_click = on_click
+        self._button_width = button_width
+
+    def _button_rect(self, cell_rect: QRect) -> QRect:
+        """Return the button geometry centered inside a cell."""
+        rect = cell_rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        width = min(self._button_width, rect.width())
+        rect.setLeft(rect.left() + (rect.width() - width) // 2)
+        rect.setWidth(width)
+        return rect
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = self._button_rect(option.rect)
+        button.text = self._text
+        button.state = QStyle.StateFlag.State_Enabled
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            button.state |= QStyle.StateFlag.State_MouseOver
+
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(
+            QStyle.ControlElement.CE_PushButton, button, painter, option.widget
+        )
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and self._button_rect(option.rect).contains(event.position().toPoint())
+        ):
+            self._on_click(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class _QuerySignals(QObject):
+    """Signals emitted by _QueryWorker back to the GUI thread."""
+
+    done = pyqtSignal(str, int, object, object)
+    failed = pyqtSignal(str, int, str)
+
+
+class _WorkerConnection:
+    """Exposes a worker thread's connection the way CategoryManager expects."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+class _QueryWorker(QRunnable):
+    """
+    Runs a read-only category query on the global thread pool.
+
+    SQLite connections are bound to the thread that created them, so the
+    worker opens its own connection for the duration of the query.
+    Results are delivered through queued signals together with the key,
+    request token and data version they were issued with.
+    """
+
+    def __init__(self, db_manager, key: str, token: int, version, query):
+        """
+        Initialize the worker.
+
+        Args:
+            db_manager: Shared DatabaseManager, used only to open a connection
+            key: Name of the query kind ('categories', 'budgets', 'alerts')
+            token: Request number, used to drop superseded results
+            version: Data version the query was issued for
+            query: Callable taking a CategoryManager and returning the result
+        """
+        super().__init__()
+        self.signals = _QuerySignals()
+        self._db_manager = db_manager
+        self._key = key
+        self._token = token
+        self._version = version
+        self._query = query
+
+    def run(self):
+        conn = None
+        try:
+            conn = self._db_manager.open_connection()
+            result = self._query(CategoryManager(_WorkerConnection(conn)))
+        except Exception as e:
+            self.signals.failed.emit(self._key, self._token, str(e))
+        else:
+            self.signals.done.emit(self._key, self._token, self._version, result)
+        finally:
+            if conn is not None:
+                conn.close()
+
 
 class CategoriesDialog(QDialog):
     """Dialog for managing categories and budgets."""
@@ -39,14 +477,35 @@ class CategoriesDialog(QDialog):
         self.db_manager = db_manager
         self.category_manager = CategoryManager(db_manager)
 
+        # Categories, budget rows and alerts HTML, cached per database version
+        self._categories_cache = None
+        self._budgets_cache = None
+        self._alerts_cache = None
+
+        # Latest (token, version) issued per background query kind
+        self._pending_queries = {}
+
+        # Tabs whose data has been loaded; the others load on first view
+        self._loaded = {0: False, 1: False, 2: False}
+
+        # Current month date bounds, recomputed when the month changes
+        self._month_key = None
+        self._start_date = None
+        self._end_date = None
+
+        # Coalesce reloads and data_changed emits to one per event loop pass
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(0)
+        self._reload_timer.timeout.connect(self._do_reload)
+
         self.setWindowTitle("Categories & Budget Management")
         self.setModal(False)
         self.resize(900, 700)
 
         self._setup_ui()
         self._apply_styles()
-        self._load_categories()
-        self._check_budget_alerts()
+        self._on_tab_changed(self.tabs.currentIndex())
 
     def _setup_ui(self):
         """Setup the user interface."""
@@ -59,11 +518,12 @@ class CategoriesDialog(QDialog):
         layout.addWidget(title)
 
         # Create tabs
-        tabs = QTabWidget()
-        tabs.addTab(self._create_categories_tab(), "📋 Categories")
-        tabs.addTab(self._create_budget_tab(), "💰 Budgets")
-        tabs.addTab(self._create_alerts_tab(), "⚠️ Alerts")
-        layout.addWidget(tabs)
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self._create_categories_tab(), "📋 Categories")
+        self.tabs.addTab(self._create_budget_tab(), "💰 Budgets")
+        self.tabs.addTab(self._create_alerts_tab(), "⚠️ Alerts")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        layout.addWidget(self.tabs)
 
         # Close button
         button_layout = QHBoxLayout()
@@ -109,19 +569,8 @@ class CategoriesDialog(QDialog):
         color_layout = QVBoxLayout()
         color_layout.addWidget(QLabel("Color:"))
         self.category_color_combo = QComboBox()
-        self.category_color_combo.addItems(
-            [
-                "Red (#ef4444)",
-                "Green (#10b981)",
-                "Blue (#3b82f6)",
-                "Yellow (#eab308)",
-                "Purple (#8b5cf6)",
-                "Pink (#ec4899)",
-                "Teal (#14b8a6)",
-                "Orange (#f59e0b)",
-                "Gray (#6b7280)",
-            ]
-        )
+        for color_name, hex_code in _PALETTE:
+            self.category_color_combo.addItem(f"{color_name} ({hex_code})", hex_code)
         color_layout.addWidget(self.category_color_combo)
         form_layout.addLayout(color_layout, 1)
 
@@ -165,18 +614,23 @@ class CategoriesDialog(QDialog):
         toolbar_layout = QHBoxLayout()
 
         refresh_btn = QPushButton("🔄 Refresh")
-        refresh_btn.clicked.connect(self._load_categories)
+        refresh_btn.clicked.connect(self._reload_tabs)
         toolbar_layout.addWidget(refresh_btn)
 
         toolbar_layout.addStretch()
         table_layout.addLayout(toolbar_layout)
 
         # Table
-        self.categories_table = QTableWidget()
-        self.categories_table.setColumnCount(7)
-        self.categories_table.setHorizontalHeaderLabels(
-            ["ID", "Icon", "Name", "Type", "Color", "In Use", "Actions"]
+        self.categories_model = CategoriesModel(self)
+        self.categories_table = QTableView()
+        self.categories_table.setModel(self.categories_model)
+        self.categories_action_delegate = ActionDelegate(
+            "🗑️", self._delete_category_by_row, parent=self.categories_table
+        )
+        self.categories_table.setItemDelegateForColumn(
+            6, self.categories_action_delegate
         )
+        self.categories_table.setMouseTracking(True)
 
         header = self.categories_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
@@ -190,7 +644,7 @@ class CategoriesDialog(QDialog):
 
         self.categories_table.setAlternatingRowColors(True)
         self.categories_table.setSelectionBehavior(
-            QTableWidget.SelectionBehavior.SelectRows
+            QAbstractItemView.SelectionBehavior.SelectRows
         )
 
         table_layout.addWidget(self.categories_table)
@@ -217,18 +671,19 @@ class CategoriesDialog(QDialog):
         layout.addWidget(info_label)
 
         # Budget table
-        self.budget_table = QTableWidget()
-        self.budget_table.setColumnCount(6)
-        self.budget_table.setHorizontalHeaderLabels(
-            [
-                "Category",
-                "Budget Limit (€)",
-                "Spent This Month (€)",
-                "Remaining (€)",
-                "Usage %",
-                "Update",
-            ]
+        self.budget_model = BudgetModel(self)
+        self.budget_table = QTableView()
+        self.budget_table.setModel(self.budget_model)
+        self.budget_bar_delegate = BudgetBarDelegate(self.budget_table)
+        self.budget_table.setItemDelegateForColumn(4, self.budget_bar_delegate)
+        self.budget_action_delegate = ActionDelegate(
+            "Set",
+            self._set_budget_limit_by_row,
+            button_width=80,
+            parent=self.budget_table,
         )
+        self.budget_table.setItemDelegateForColumn(5, self.budget_action_delegate)
+        self.budget_table.setMouseTracking(True)
 
         header = self.budget_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
@@ -278,12 +733,12 @@ class CategoriesDialog(QDialog):
                 padding: 0 5px;
                 color: #1f2937;
             }
-            QTableWidget {
+            QTableView {
                 border: 1px solid #d1d5db;
                 border-radius: 4px;
                 background-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
             }
             QHeaderView::section {
@@ -313,15 +768,16 @@ class CategoriesDialog(QDialog):
 
             category_type = self.category_type_combo.currentText()
 
-            # Extract color hex from combo text
-            color_text = self.category_color_combo.currentText()
-            color = color_text.split("(")[1].rstrip(")")
+            color = self.category_color_combo.currentData()
 
             icon = self.category_icon_input.text().strip() or None
 
-            # Check if category already exists
-            existing = self.category_manager.get_category_by_name(name)
-            if existing:
+            # Add category (the UNIQUE constraint on name rejects duplicates)
+            try:
+                self.category_manager.add_category(
+                    name=name, category_type=category_type, color=color, icon=icon
+                )
+            except sqlite3.IntegrityError:
                 QMessageBox.warning(
                     self,
                     "Duplicate Category",
@@ -329,11 +785,6 @@ class CategoriesDialog(QDialog):
                 )
                 return
 
-            # Add category
-            category_id = self.category_manager.add_category(
-                name=name, category_type=category_type, color=color, icon=icon
-            )
-
             QMessageBox.information(
                 self, "Success", f"Category '{name}' added successfully!"
             )
@@ -343,8 +794,7 @@ class CategoriesDialog(QDialog):
             self.category_icon_input.clear()
 
             # Reload table
-            self._load_categories()
-            self.data_changed.emit()
+            self._reload_timer.start()
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to add category:\n{str(e)}")
@@ -352,180 +802,173 @@ class CategoriesDialog(QDialog):
 
     def _load_categories(self):
         """Load categories into table."""
-        categories = self.category_manager.get_all_categories()
-
-        self.categories_table.setRowCount(len(categories))
-
-        for row, category in enumerate(categories):
-            # ID
-            self.categories_table.setItem(row, 0, QTableWidgetItem(str(category["id"])))
-
-            # Icon
-            icon = category.get("icon", "")
-            icon_item = QTableWidgetItem(icon)
-            icon_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.categories_table.setItem(row, 1, icon_item)
-
-            # Name
-            name_item = QTableWidgetItem(category["name"])
-            name_item.setForeground(QColor(category.get("color", "#000000")))
-            self.categories_table.setItem(row, 2, name_item)
-
-            # Type
-            type_item = QTableWidgetItem(category["type"].title())
-            self.categories_table.setItem(row, 3, type_item)
-
-            # Color
-            color_item = QTableWidgetItem(category.get("color", ""))
-            color_item.setBackground(QColor(category.get("color", "#ffffff")))
-            self.categories_table.setItem(row, 4, color_item)
-
-            # In use status
-            in_use = self.category_manager._is_category_in_use(category["id"])
-            in_use_item = QTableWidgetItem("Yes" if in_use else "No")
-            in_use_item.setForeground(
-                QColor("#10b981") if in_use else QColor("#6b7280")
-            )
-            self.categories_table.setItem(row, 5, in_use_item)
-
-            # Actions
-            actions_widget = self._create_category_action_buttons(category["id"])
-            self.categories_table.setCellWidget(row, 6, actions_widget)
-
-        # Load budgets
-        self._load_budgets()
+        # Skip the query when nothing changed since the last load
+        version = self.category_manager.get_data_version()
+        if self._categories_cache is not None and self._categories_cache[0] == version:
+            return
 
-    def _load_budgets(self):
-        """Load budget information."""
-        from datetime import datetime
+        # A single query returns every column, including the derived in-use flag
+        self._run_query(
+            "categories",
+            version,
+            lambda manager: manager.get_category_columns(include_in_use=True),
+        )
 
-        # Get current month stats
-        now = datetime.now()
-        start_date = f"{now.year:04d}-{now.month:02d}-01"
+    def _apply_categories(self, version, columns):
+        """Show categories loaded in the background."""
+        self.categories_model.set_categories(columns)
+        self._categories_cache = (version, columns)
+
+    def _run_query(self, key: str, version, query):
+        """
+        Run a read query on the thread pool and apply the result when done.
+
+        A query already in flight for the same key and version is reused;
+        results of superseded requests are discarded.
+
+        Args:
+            key: Query kind ('categories', 'budgets' or 'alerts')
+            version: Data version the result will be cached under
+            query: Callable taking a CategoryManager and returning the result
+        """
+        pending = self._pending_queries.get(key)
+        if pending is not None and pending[1] == version:
+            return
 
-        # Calculate end date
-        if now.month == 12:
-            next_month = datetime(now.year + 1, 1, 1)
-        else:
-            next_month = datetime(now.year, now.month + 1, 1)
+        token = pending[0] + 1 if pending is not None else 1
+        self._pending_queries[key] = (token, version)
 
-        from datetime import timedelta
+        worker = _QueryWorker(self.db_manager, key, token, version, query)
+        worker.signals.done.connect(self._on_query_done)
+        worker.signals.failed.connect(self._on_query_failed)
+        QThreadPool.globalInstance().start(worker)
 
-        last_day = (next_month - timedelta(days=1)).day
-        end_date = f"{now.year:04d}-{now.month:02d}-{last_day:02d}"
+    def _on_query_done(self, key: str, token: int, version, result):
+        """Apply a background query result unless it has been superseded."""
+        pending = self._pending_queries.get(key)
+        if pending is None or pending[0] != token:
+            return
 
-        # Get expense categories
-        categories = self.category_manager.get_all_categories(category_type="expense")
+        self._pending_queries[key] = (token, None)
+        handlers = {
+            "categories": self._apply_categories,
+            "budgets": self._apply_budgets,
+            "alerts": self._apply_alerts,
+        }
+        handlers[key](version, result)
+
+    def _on_query_failed(self, key: str, token: int, error: str):
+        """Log a failed background query."""
+        pending = self._pending_queries.get(key)
+        if pending is not None and pending[0] == token:
+            self._pending_queries[key] = (token, None)
+        logger.error(f"Failed to load {key}: {error}")
+
+    def _on_tab_changed(self, index: int):
+        """Load a tab's data the first time it is shown."""
+        if self._loaded.get(index, True):
+            return
 
-        self.budget_table.setRowCount(len(categories))
+        self._loaded[index] = True
+        loaders = {
+            0: self._load_categories,
+            1: self._load_budgets,
+            2: self._check_budget_alerts,
+        }
+        loaders[index]()
+
+    def _reload_tabs(self):
+        """Mark every tab as stale and reload the visible one."""
+        self._loaded = dict.fromkeys(self._loaded, False)
+        self._on_tab_changed(self.tabs.currentIndex())
+
+    def _do_reload(self):
+        """Reload tabs and notify listeners once for pending changes."""
+        self._reload_tabs()
+        self.data_changed.emit()
+
+    def _current_month(self) -> tuple:
+        """
+        Get the current month and its date bounds.
+
+        The formatted bounds are recomputed only when the month changes.
+
+        Returns:
+            Tuple of ((year, month), start_date, end_date)
+        """
+        today = date.today()
+        month_key = (today.year, today.month)
+        if self._month_key != month_key:
+            last_day = monthrange(today.year, today.month)[1]
+            self._start_date = f"{today.year:04d}-{today.month:02d}-01"
+            self._end_date = f"{today.year:04d}-{today.month:02d}-{last_day:02d}"
+            self._month_key = month_key
+        return self._month_key, self._start_date, self._end_date
 
-        for row, category in enumerate(categories):
-            # Category name
-            name_item = QTableWidgetItem(
-                f"{category.get('icon', '')} {category['name']}"
-            )
-            self.budget_table.setItem(row, 0, name_item)
+    def _load_budgets(self):
+        """Load budget information."""
+        # Get current month stats
+        month_key, start_date, end_date = self._current_month()
 
-            # Get stats
-            stats = self.category_manager.get_category_statistics(
-                category["name"], start_date, end_date
-            )
+        # Skip the queries when nothing changed since the last load
+        version = (self.category_manager.get_data_version(), month_key)
+        if self._budgets_cache is not None and self._budgets_cache[0] == version:
+            return
 
-            spent = abs(stats["total_amount"])
-            budget_limit = category.get("budget_limit", 0) or 0
+        # Reuse rows computed by a previous dialog for the same data and month
+        cached = _BUDGETS_CACHE.get(self.db_manager)
+        if cached is not None and cached[0] == version:
+            pending = self._pending_queries.get("budgets")
+            if pending is not None:
+                self._pending_queries["budgets"] = (pending[0] + 1, None)
+            self._apply_budgets(*cached)
+            return
 
-            # Budget limit
-            budget_item = QTableWidgetItem(
-                f"{budget_limit:,.2f}" if budget_limit > 0 else "Not set"
-            )
-            self.budget_table.setItem(row, 1, budget_item)
+        self._run_query(
+            "budgets",
+            version,
+            lambda manager: self._query_budgets(manager, start_date, end_date),
+        )
 
-            # Spent
-            spent_item = QTableWidgetItem(f"{spent:,.2f}")
-            self.budget_table.setItem(row, 2, spent_item)
+    @staticmethod
+    def _query_budgets(manager, start_date: str, end_date: str) -> tuple:
+        """
+        Compute budget rows for expense categories.
 
-            # Remaining
-            if budget_limit > 0:
-                remaining = budget_limit - spent
-                remaining_item = QTableWidgetItem(f"{remaining:,.2f}")
-                remaining_item.setForeground(
-                    QColor("#10b981") if remaining >= 0 else QColor("#dc2626")
-                )
-                self.budget_table.setItem(row, 3, remaining_item)
-            else:
-                self.budget_table.setItem(row, 3, QTableWidgetItem("N/A"))
-
-            # Usage percentage with progress bar
-            if budget_limit > 0:
-                usage_pct = (spent / budget_limit * 100) if budget_limit > 0 else 0
-                progress_widget = QWidget()
-                progress_layout = QVBoxLayout()
-                progress_layout.setContentsMargins(4, 4, 4, 4)
-
-                progress_bar = QProgressBar()
-                progress_bar.setValue(int(min(usage_pct, 100)))
-                progress_bar.setFormat(f"{usage_pct:.1f}%")
-
-                # Color based on usage
-                if usage_pct >= 100:
-                    progress_bar.setStyleSheet(
-                        "QProgressBar::chunk { background-color: #dc2626; }"
-                    )
-                elif usage_pct >= 80:
-                    progress_bar.setStyleSheet(
-                        "QProgressBar::chunk { background-color: #f59e0b; }"
-                    )
-                else:
-                    progress_bar.setStyleSheet(
-                        "QProgressBar::chunk { background-color: #10b981; }"
-                    )
-
-                progress_layout.addWidget(progress_bar)
-                progress_widget.setLayout(progress_layout)
-                self.budget_table.setCellWidget(row, 4, progress_widget)
-            else:
-                self.budget_table.setItem(row, 4, QTableWidgetItem("N/A"))
-
-            # Update button
-            update_widget = self._create_budget_update_button(
-                category["id"], budget_limit
-            )
-            self.budget_table.setCellWidget(row, 5, update_widget)
+        Args:
+            manager: CategoryManager to query with
+            start_date: Start of the month (YYYY-MM-DD)
+            end_date: End of the month (YYYY-MM-DD)
 
-    def _create_category_action_buttons(self, category_id: int) -> QWidget:
-        """Create action buttons for a category."""
-        widget = QWidget()
-        layout = QHBoxLayout()
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(4)
+        Returns:
+            Tuple of (ids, labels, limits, spent) column lists
+        """
+        # Get expense categories
+        columns = manager.get_category_columns(category_type="expense")
 
-        # Delete button
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setToolTip("Delete category")
-        delete_btn.setMaximumWidth(50)
-        delete_btn.clicked.connect(lambda: self._delete_category(category_id))
-        layout.addWidget(delete_btn)
+        totals = manager.get_monthly_totals(
+            start_date, end_date, category_type="expense"
+        )
 
-        widget.setLayout(layout)
-        return widget
+        ids = columns["id"]
+        labels = [
+            f"{icon or ''} {name}"
+            for icon, name in zip(columns["icon"], columns["name"])
+        ]
+        limits = [limit or 0 for limit in columns["budget_limit"]]
+        spent = [abs(round(totals.get(name, 0.0), 2)) for name in columns["name"]]
 
-    def _create_budget_update_button(
-        self, category_id: int, current_limit: float
-    ) -> QWidget:
-        """Create budget update button."""
-        widget = QWidget()
-        layout = QHBoxLayout()
-        layout.setContentsMargins(4, 4, 4, 4)
+        return ids, labels, limits, spent
 
-        update_btn = QPushButton("Set")
-        update_btn.setMaximumWidth(80)
-        update_btn.clicked.connect(
-            lambda: self._set_budget_limit(category_id, current_limit)
-        )
-        layout.addWidget(update_btn)
+    def _apply_budgets(self, version, budgets):
+        """Show budget rows loaded in the background."""
+        self.budget_model.set_budgets(*budgets)
+        self._budgets_cache = (version, budgets)
+        _BUDGETS_CACHE[self.db_manager] = self._budgets_cache
 
-        widget.setLayout(layout)
-        return widget
+    def _delete_category_by_row(self, row: int):
+        """Delete the category displayed at the given table row."""
+        self._delete_category(self.categories_model.category_id(row))
 
     def _delete_category(self, category_id: int):
         """Delete a category."""
@@ -553,14 +996,17 @@ class CategoriesDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.category_manager.delete_category(category_id)
-                self._load_categories()
-                self.data_changed.emit()
+                self._reload_timer.start()
                 QMessageBox.information(self, "Success", "Category deleted.")
             except Exception as e:
                 QMessageBox.critical(
                     self, "Error", f"Failed to delete category:\n{str(e)}"
                 )
 
+    def _set_budget_limit_by_row(self, row: int):
+        """Set the budget limit of the category displayed at the given row."""
+        self._set_budget_limit(*self.budget_model.budget(row))
+
     def _set_budget_limit(self, category_id: int, current_limit: float):
         """Set budget limit for a category."""
         from PyQt6.QtWidgets import QInputDialog
@@ -584,9 +1030,7 @@ class CategoriesDialog(QDialog):
                 self.category_manager.update_category(
                     category_id, budget_limit=new_limit
                 )
-                self._load_budgets()
-                self._check_budget_alerts()
-                self.data_changed.emit()
+                self._reload_timer.start()
                 QMessageBox.information(
                     self,
                     "Success",
@@ -599,44 +1043,50 @@ class CategoriesDialog(QDialog):
 
     def _check_budget_alerts(self):
         """Check and display budget alerts."""
-        alerts = self.category_manager.get_budget_alerts()
-
-        if not alerts:
-            self.alerts_text.setHtml(
-                "<div style='padding: 20px; text-align: center; color: #10b981;'>"
-                "<h2>✓ All Good!</h2>"
-                "<p>No budget alerts at this time. You're staying within your limits.</p>"
-                "</div>"
-            )
+        month_key = self._current_month()[0]
+        version = (self.category_manager.get_data_version(), month_key)
+        if self._alerts_cache is not None and self._alerts_cache[0] == version:
+            self.alerts_text.setHtml(self._alerts_cache[1])
             return
 
-        html = "<div style='padding: 10px;'>"
-        html += "<h2 style='color: #dc2626;'>⚠️ Budget Alerts</h2>"
-        html += "<p>The following categories have reached or exceeded 80% of their budget limits:</p>"
-        html += (
-            "<table style='width: 100%; border-collapse: collapse; margin-top: 10px;'>"
+        self._run_query(
+            "alerts",
+            version,
+            lambda manager: self._render_budget_alerts(manager.get_budget_alerts()),
         )
-        html += "<tr style='background-color: #f3f4f6; font-weight: bold;'>"
-        html += "<th style='padding: 8px; text-align: left;'>Category</th>"
-        html += "<th style='padding: 8px; text-align: right;'>Budget</th>"
-        html += "<th style='padding: 8px; text-align: right;'>Spent</th>"
-        html += "<th style='padding: 8px; text-align: right;'>Remaining</th>"
-        html += "<th style='padding: 8px; text-align: right;'>Usage</th>"
-        html += "</tr>"
-
-        for alert in alerts:
-            bg_color = "#fee2e2" if alert["alert_level"] == "critical" else "#fef3c7"
-            html += f"<tr style='background-color: {bg_color};'>"
-            html += (
-                f"<td style='padding: 8px;'>{alert['icon']} {alert['category']}</td>"
-            )
-            html += f"<td style='padding: 8px; text-align: right;'>€{alert['budget_limit']:,.2f}</td>"
-            html += f"<td style='padding: 8px; text-align: right;'>€{alert['spent']:,.2f}</td>"
-            html += f"<td style='padding: 8px; text-align: right;'>€{alert['remaining']:,.2f}</td>"
-            html += f"<td style='padding: 8px; text-align: right; font-weight: bold;'>{alert['usage_percent']:.1f}%</td>"
-            html += "</tr>"
-
-        html += "</table>"
-        html += "</div>"
 
+    def _apply_alerts(self, version, html):
+        """Show budget alerts rendered in the background."""
+        self._alerts_cache = (version, html)
         self.alerts_text.setHtml(html)
+
+    @staticmethod
+    def _render_budget_alerts(alerts) -> str:
+        """
+        Build the budget alerts HTML.
+
+        Args:
+            alerts: Alerts returned by CategoryManager.get_budget_alerts
+
+        Returns:
+            HTML describing categories at or above 80% of their budget
+        """
+        if not alerts:
+            return _ALERTS_EMPTY_HTML
+
+        parts = [_ALERTS_HEADER_HTML]
+        parts.extend(
+            _ALERTS_ROW_TMPL.format(
+                bg="#fee2e2" if alert["alert_level"] == "critical" else "#fef3c7",
+                icon=alert["icon"],
+                category=alert["category"],
+                budget_limit=alert["budget_limit"],
+                spent=alert["spent"],
+                remaining=alert["remaining"],
+                usage_percent=alert["usage_percent"],
+            )
+            for alert in alerts
+        )
+        parts.append(_ALERTS_FOOTER_HTML)
+
+        return "".join(parts)
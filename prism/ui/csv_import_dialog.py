@@ -3,6 +3,8 @@ CSV Import Dialog for Prism application.
 Provides a user-friendly interface for importing transactions from CSV files.
 """
 
+import time
+
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -20,33 +22,154 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from pathlib import Path
 from ..utils.csv_import import CSVImporter, CSVImportError
+from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Dialog stylesheet, parsed by Qt in a single setStyleSheet call
+_DIALOG_STYLESHEET = """
+    QDialog {
+        background-color: #ffffff;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #e5e7eb;
+        border-radius: 6px;
+        margin-top: 12px;
+        padding-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+        color: #1f2937;
+    }
+    QLabel {
+        color: #374151;
+    }
+    QPushButton {
+        background-color: #f3f4f6;
+        color: #1f2937;
+        border: 1px solid #d1d5db;
+        padding: 6px 12px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #e5e7eb;
+    }
+    QPushButton#importButton {
+        background-color: #3b82f6;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#importButton:hover {
+        background-color: #2563eb;
+    }
+    QPushButton#importButton:disabled {
+        background-color: #9ca3af;
+    }
+    QCheckBox {
+        color: #374151;
+    }
+    QComboBox {
+        border: 1px solid #d1d5db;
+        border-radius: 4px;
+        padding: 4px 8px;
+        background-color: white;
+    }
+"""
+
 
 class ImportThread(QThread):
     """Thread for handling CSV import in background."""
 
     progress = pyqtSignal(str)
-    finished = pyqtSignal(int, int, list)
+    finished = pyqtSignal(int, int, list, int)
     error = pyqtSignal(str)
 
-    def __init__(self, importer, file_path, skip_duplicates, default_type):
+    # Error messages sent back to the dialog; further ones are only counted
+    MAX_ERRORS = 100
+
+    # Minimum delay between two progress updates, in seconds
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, importer, file_paths, skip_duplicates, default_type):
         super().__init__()
         self.importer = importer
-        self.file_path = file_path
+        self.file_paths = file_paths
         self.skip_duplicates = skip_duplicates
         self.default_type = default_type
+        self.chunk_size = get_config().database.import_batch_size
+        self._last_progress = 0.0
+        self._suppressed_errors = 0
+
+    def _emit_progress(self, message: str):
+        """Emit a progress update unless one was sent very recently."""
+        now = time.monotonic()
+        if now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(message)
+
+    def _add_errors(self, errors: list, new_errors: list):
+        """Keep the first MAX_ERRORS error messages and count the rest."""
+        room = self.MAX_ERRORS - len(errors)
+        errors.extend(new_errors[:room])
+        self._suppressed_errors += max(0, len(new_errors) - room)
 
     def run(self):
         """Run the import process."""
         try:
             self.progress.emit("Starting import...")
-            successful, failed, errors = self.importer.import_from_csv(
-                self.file_path, self.skip_duplicates, self.default_type
-            )
-            self.finished.emit(successful, failed, errors)
+
+            successful = 0
+            failed = 0
+            errors = []
+
+            # Existing transactions are loaded once and shared by all files
+            existing_transactions = None
+            multiple_files = len(self.file_paths) > 1
+
+            for file_path in self.file_paths:
+                file_name = Path(file_path).name
+                try:
+                    existing_transactions = self.importer.prepare_import(
+                        file_path, self.skip_duplicates, existing_transactions
+                    )
+                except CSVImportError as e:
+                    self._add_errors(errors, [f"{file_name}: {str(e)}"])
+                    continue
+
+                # Commit one batch at a time and report progress between batches;
+                # batches committed before a read error stay imported and counted
+                batches = self.importer.import_batches(
+                    file_path,
+                    self.skip_duplicates,
+                    self.default_type,
+                    existing_transactions,
+                    self.chunk_size,
+                )
+                try:
+                    for batch_successful, batch_failed, batch_errors in batches:
+                        successful += batch_successful
+                        failed += batch_failed
+                        if multiple_files:
+                            batch_errors = [f"{file_name}: {e}" for e in batch_errors]
+                        self._add_errors(errors, batch_errors)
+                        self._emit_progress(
+                            f"Processed {successful + failed} rows "
+                            f"({successful} imported)..."
+                        )
+                except Exception as e:
+                    logger.error(f"CSV import error in {file_name}: {str(e)}")
+                    self._add_errors(
+                        errors, [f"{file_name}: Failed to read CSV file: {str(e)}"]
+                    )
+
+            self.finished.emit(successful, failed, errors, self._suppressed_errors)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -58,7 +181,7 @@ class CSVImportDialog(QDialog):
         super().__init__(parent)
         self.db_manager = db_manager
         self.importer = CSVImporter(db_manager)
-        self.selected_file = None
+        self.selected_files = []
         self.import_thread = None
 
         self.setWindowTitle("Import Transactions from CSV")
@@ -106,7 +229,7 @@ class CSVImportDialog(QDialog):
         layout.addWidget(instructions_group)
 
         # File selection
-        file_group = QGroupBox("Select CSV File")
+        file_group = QGroupBox("Select CSV Files")
         file_layout = QVBoxLayout()
 
         file_select_layout = QHBoxLayout()
@@ -172,24 +295,7 @@ class CSVImportDialog(QDialog):
         self.import_btn = QPushButton("Import")
         self.import_btn.setEnabled(False)
         self.import_btn.clicked.connect(self._start_import)
-        self.import_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #3b82f6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2563eb;
-            }
-            QPushButton:disabled {
-                background-color: #9ca3af;
-            }
-        """
-        )
+        self.import_btn.setObjectName("importButton")
         button_layout.addWidget(self.import_btn)
 
         self.close_btn = QPushButton("Close")
@@ -202,71 +308,38 @@ class CSVImportDialog(QDialog):
 
     def _apply_styles(self):
         """Apply custom styles to the dialog."""
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #e5e7eb;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #1f2937;
-            }
-            QLabel {
-                color: #374151;
-            }
-            QPushButton {
-                background-color: #f3f4f6;
-                color: #1f2937;
-                border: 1px solid #d1d5db;
-                padding: 6px 12px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #e5e7eb;
-            }
-            QCheckBox {
-                color: #374151;
-            }
-            QComboBox {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 4px 8px;
-                background-color: white;
-            }
-        """
-        )
+        self.setStyleSheet(_DIALOG_STYLESHEET)
 
     def _select_file(self):
-        """Open file dialog to select CSV file."""
-        file_path, _ = QFileDialog.getOpenFileName(
+        """Open file dialog to select one or more CSV files."""
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self,
-            "Select CSV File",
+            "Select CSV Files",
             str(Path.home() / "Downloads"),
             "CSV Files (*.csv);;All Files (*)",
         )
 
-        if file_path:
-            self.selected_file = file_path
-            self.file_label.setText(f"📄 {Path(file_path).name}")
+        if file_paths:
+            self.selected_files = file_paths
+            if len(file_paths) == 1:
+                self.file_label.setText(f"📄 {Path(file_paths[0]).name}")
+            else:
+                self.file_label.setText(f"📄 {len(file_paths)} files selected")
             self.file_label.setStyleSheet("color: #059669; font-weight: bold;")
             self.import_btn.setEnabled(True)
 
-            # Validate file
-            is_valid, error_msg = self.importer.validate_csv_file(file_path)
+            # Validate files
+            for file_path in file_paths:
+                is_valid, error_msg = self.importer.validate_csv_file(file_path)
+                if not is_valid:
+                    break
             if not is_valid:
                 QMessageBox.warning(
-                    self, "Invalid CSV File", f"File validation failed:\n\n{error_msg}"
+                    self,
+                    "Invalid CSV File",
+                    f"File validation failed for {Path(file_path).name}:\n\n{error_msg}",
                 )
-                self.selected_file = None
+                self.selected_files = []
                 self.file_label.setText("No file selected")
                 self.file_label.setStyleSheet("color: #6b7280; font-style: italic;")
                 self.import_btn.setEnabled(False)
@@ -296,7 +369,7 @@ class CSVImportDialog(QDialog):
 
     def _start_import(self):
         """Start the import process."""
-        if not self.selected_file:
+        if not self.selected_files:
             return
 
         # Disable buttons during import
@@ -312,7 +385,7 @@ class CSVImportDialog(QDialog):
 
         # Create and start import thread
         self.import_thread = ImportThread(
-            self.importer, self.selected_file, skip_duplicates, default_type
+            self.importer, self.selected_files, skip_duplicates, default_type
         )
         self.import_thread.progress.connect(self._on_progress)
         self.import_thread.finished.connect(self._on_import_finished)
@@ -323,7 +396,9 @@ class CSVImportDialog(QDialog):
         """Handle progress updates."""
         logger.info(message)
 
-    def _on_import_finished(self, successful: int, failed: int, errors: list):
+    def _on_import_finished(
+        self, successful: int, failed: int, errors: list, suppressed_errors: int
+    ):
         """Handle import completion."""
         self.progress_bar.setVisible(False)
         self.import_btn.setEnabled(True)
@@ -331,7 +406,9 @@ class CSVImportDialog(QDialog):
 
         # Show results
         self.status_text.setVisible(True)
-        summary = self.importer.get_import_summary(successful, failed, errors)
+        summary = self.importer.get_import_summary(
+            successful, failed, errors, suppressed_errors
+        )
         self.status_text.setPlainText(summary)
 
         # Show summary dialog
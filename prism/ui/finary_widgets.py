@@ -17,6 +17,43 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QFont, QColor
 
+# Stylesheet classes for values, keyed by the card's positive flag
+_VALUE_CLASSES = {
+    True: "card-value positive",
+    False: "card-value negative",
+    None: "card-value",
+}
+
+# Stylesheet classes for subtitles, keyed by the card's positive flag
+_SUBTITLE_CLASSES = {
+    True: "positive",
+    False: "negative",
+    None: "card-subtitle",
+}
+
+
+def _performance_class(performance: str) -> str:
+    """Get the stylesheet class of a signed performance string like '+9.55%'."""
+    return "negative" if performance[:1] == "-" else "positive"
+
+
+def _set_style_class(widget: QWidget, style_class: str):
+    """
+    Set a widget's stylesheet class, re-polishing only when it changes.
+
+    Re-polishing makes Qt re-resolve the stylesheet for the widget, so it
+    is skipped on updates that keep the same positive/negative class.
+
+    Args:
+        widget: Widget styled through its "class" property
+        style_class: New class value
+    """
+    if widget.property("class") == style_class:
+        return
+    widget.setProperty("class", style_class)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
 
 class FinaryAssetCard(QFrame):
     """
@@ -91,10 +128,7 @@ class FinaryAssetCard(QFrame):
         # Performance (green if positive, red if negative)
         if performance:
             self.performance_label = QLabel(performance)
-            is_positive = performance.startswith("+") or not performance.startswith("-")
-            self.performance_label.setProperty(
-                "class", "positive" if is_positive else "negative"
-            )
+            self.performance_label.setProperty("class", _performance_class(performance))
             layout.addWidget(self.performance_label)
 
         layout.addStretch()
@@ -104,12 +138,7 @@ class FinaryAssetCard(QFrame):
         self.value_label.setText(value)
         if performance and hasattr(self, "performance_label"):
             self.performance_label.setText(performance)
-            is_positive = performance.startswith("+")
-            self.performance_label.setProperty(
-                "class", "positive" if is_positive else "negative"
-            )
-            self.performance_label.style().unpolish(self.performance_label)
-            self.performance_label.style().polish(self.performance_label)
+            _set_style_class(self.performance_label, _performance_class(performance))
 
     def mousePressEvent(self, event):
         """Handle click events."""
@@ -169,23 +198,13 @@ class FinarySummaryCard(QFrame):
 
         # Value (large, bold)
         self.value_label = QLabel(value)
-        if positive is True:
-            self.value_label.setProperty("class", "card-value positive")
-        elif positive is False:
-            self.value_label.setProperty("class", "card-value negative")
-        else:
-            self.value_label.setProperty("class", "card-value")
+        self.value_label.setProperty("class", _VALUE_CLASSES[positive])
         layout.addWidget(self.value_label)
 
         # Subtitle/performance
         if subtitle:
             self.subtitle_label = QLabel(subtitle)
-            if positive is True:
-                self.subtitle_label.setProperty("class", "positive")
-            elif positive is False:
-                self.subtitle_label.setProperty("class", "negative")
-            else:
-                self.subtitle_label.setProperty("class", "card-subtitle")
+            self.subtitle_label.setProperty("class", _SUBTITLE_CLASSES[positive])
             layout.addWidget(self.subtitle_label)
 
         layout.addStretch()
@@ -198,15 +217,7 @@ class FinarySummaryCard(QFrame):
     ):
         """Update card value."""
         self.value_label.setText(value)
-        if positive is True:
-            self.value_label.setProperty("class", "card-value positive")
-        elif positive is False:
-            self.value_label.setProperty("class", "card-value negative")
-        else:
-            self.value_label.setProperty("class", "card-value")
-
-        self.value_label.style().unpolish(self.value_label)
-        self.value_label.style().polish(self.value_label)
+        _set_style_class(self.value_label, _VALUE_CLASSES[positive])
 
         if subtitle and hasattr(self, "subtitle_label"):
             self.subtitle_label.setText(subtitle)
@@ -537,9 +548,10 @@ def create_finary_card_grid(cards: list, columns: int = 3) -> QWidget:
     grid.setSpacing(16)
     grid.setContentsMargins(0, 0, 0, 0)
 
+    # Layout activation is deferred until the container is shown, so adding
+    # every card costs a single layout pass
     for i, card in enumerate(cards):
-        row = i // columns
-        col = i % columns
+        row, col = divmod(i, columns)
         grid.addWidget(card, row, col)
 
     return container
@@ -566,7 +578,10 @@ FINARY_COLORS = {
     "chart_orange": "#F59E0B",
 }
 
+# Fallback for unknown color names, resolved once
+_DEFAULT_FINARY_COLOR = FINARY_COLORS["accent_green"]
+
 
 def get_finary_color(name: str) -> str:
     """Get a Finary color by name."""
-    return FINARY_COLORS.get(name, FINARY_COLORS["accent_green"])
+    return FINARY_COLORS.get(name, _DEFAULT_FINARY_COLOR)
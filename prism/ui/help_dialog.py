@@ -4,6 +4,9 @@ Help dialog for Prism application.
 Provides context-sensitive help and tutorials for each section of the app.
 """
 
+import functools
+import re
+
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -15,14 +18,48 @@ from PyQt6.QtWidgets import (
     QListWidgetItem,
 )
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtGui import QIcon, QFont, QTextDocument
 
 from .tooltips import get_help_text, Tooltips
 
+# Sidebar and content stylesheets, shared by every dialog instance
+_SIDEBAR_QSS = """
+    QListWidget {
+        background-color: #f5f5f5;
+        border: none;
+        font-size: 13px;
+        padding: 5px;
+    }
+    QListWidget::item {
+        padding: 10px;
+        border-radius: 5px;
+        margin: 2px;
+    }
+    QListWidget::item:selected {
+        background-color: #2196F3;
+        color: white;
+    }
+    QListWidget::item:hover {
+        background-color: #e0e0e0;
+    }
+"""
+
+_CONTENT_QSS = """
+    QTextBrowser {
+        border: none;
+        padding: 20px;
+        font-size: 13px;
+        line-height: 1.6;
+    }
+"""
+
 
 class HelpDialog(QDialog):
     """Context-sensitive help dialog."""
 
+    # Shared instance reused by show_help
+    _instance = None
+
     def __init__(self, section: str = "welcome", parent=None):
         """
         Initialize help dialog.
@@ -36,6 +73,10 @@ class HelpDialog(QDialog):
         self.setMinimumSize(900, 600)
         self.resize(1000, 700)
 
+        # Parsed section documents, reused when a section is shown again
+        self._documents = {}
+        self._current_section = None
+
         self._init_ui()
         self._load_section(section)
 
@@ -94,55 +135,31 @@ class HelpDialog(QDialog):
             ("❓ FAQ", "faq"),
         ]
 
+        self._section_items = {}
         for title, section_id in sections:
             item = QListWidgetItem(title)
             item.setData(Qt.ItemDataRole.UserRole, section_id)
-            self.sidebar.addItem(item)
+            self._section_items[section_id] = item
 
-        # Select first item by default
+        # Insert and select without emitting currentItemChanged; the caller
+        # loads the initial section itself
+        self.sidebar.blockSignals(True)
+        for item in self._section_items.values():
+            self.sidebar.addItem(item)
         self.sidebar.setCurrentRow(0)
+        self.sidebar.blockSignals(False)
 
     def _apply_styling(self):
         """Apply custom styling to dialog."""
-        self.sidebar.setStyleSheet(
-            """
-            QListWidget {
-                background-color: #f5f5f5;
-                border: none;
-                font-size: 13px;
-                padding: 5px;
-            }
-            QListWidget::item {
-                padding: 10px;
-                border-radius: 5px;
-                margin: 2px;
-            }
-            QListWidget::item:selected {
-                background-color: #2196F3;
-                color: white;
-            }
-            QListWidget::item:hover {
-                background-color: #e0e0e0;
-            }
-        """
-        )
-
-        self.content.setStyleSheet(
-            """
-            QTextBrowser {
-                border: none;
-                padding: 20px;
-                font-size: 13px;
-                line-height: 1.6;
-            }
-        """
-        )
+        self.sidebar.setStyleSheet(_SIDEBAR_QSS)
+        self.content.setStyleSheet(_CONTENT_QSS)
 
     def _on_section_changed(self, current, previous):
         """Handle section change."""
         if current:
             section_id = current.data(Qt.ItemDataRole.UserRole)
-            self._load_section(section_id)
+            if section_id != self._current_section:
+                self._load_section(section_id)
 
     def _load_section(self, section: str):
         """
@@ -151,15 +168,23 @@ class HelpDialog(QDialog):
         Args:
             section: Section identifier
         """
-        content = self._get_section_content(section)
-        self.content.setHtml(content)
-
-        # Set sidebar selection
-        for i in range(self.sidebar.count()):
-            item = self.sidebar.item(i)
-            if item.data(Qt.ItemDataRole.UserRole) == section:
-                self.sidebar.setCurrentItem(item)
-                break
+        document = self._documents.get(section)
+        if document is None:
+            # Parented to the dialog so the browser never deletes it on swap
+            document = QTextDocument(self)
+            document.setDefaultFont(self.content.font())
+            document.setDefaultStyleSheet(_CSS)
+            document.setHtml(self._get_section_content(section))
+            self._documents[section] = document
+        self.content.setDocument(document)
+        self._current_section = section
+
+        # Sync sidebar selection without re-entering _on_section_changed
+        item = self._section_items.get(section)
+        if item is not None and item is not self.sidebar.currentItem():
+            self.sidebar.blockSignals(True)
+            self.sidebar.setCurrentItem(item)
+            self.sidebar.blockSignals(False)
 
     def _get_section_content(self, section: str) -> str:
         """
@@ -171,77 +196,102 @@ class HelpDialog(QDialog):
         Returns:
             HTML content string
         """
-        # Base CSS for all sections
-        css = """
-        <style>
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-                line-height: 1.7;
-                color: #333;
-            }
-            h1 {
-                color: #2196F3;
-                border-bottom: 3px solid #2196F3;
-                padding-bottom: 10px;
-                margin-top: 0;
-            }
-            h2 {
-                color: #1976D2;
-                margin-top: 25px;
-            }
-            h3 {
-                color: #0D47A1;
-                margin-top: 20px;
-            }
-            code {
-                background-color: #f5f5f5;
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-family: "Monaco", "Courier New", monospace;
-                font-size: 12px;
-            }
-            .tip {
-                background-color: #E3F2FD;
-                border-left: 4px solid #2196F3;
-                padding: 15px;
-                margin: 15px 0;
-                border-radius: 4px;
-            }
-            .warning {
-                background-color: #FFF3E0;
-                border-left: 4px solid #FF9800;
-                padding: 15px;
-                margin: 15px 0;
-                border-radius: 4px;
-            }
-            .success {
-                background-color: #E8F5E9;
-                border-left: 4px solid #4CAF50;
-                padding: 15px;
-                margin: 15px 0;
-                border-radius: 4px;
-            }
-            ul {
-                line-height: 1.8;
-            }
-            ol {
-                line-height: 1.8;
-            }
-            kbd {
-                background-color: #f5f5f5;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                padding: 2px 6px;
-                font-family: monospace;
-                font-size: 11px;
-            }
-        </style>
+        return _render_section(section)
+
+    @classmethod
+    def show_help(cls, section: str = "welcome", parent=None):
         """
+        Show help dialog for a specific section.
+
+        The dialog is created on first use and reused afterwards; closing it
+        only hides it.
+
+        Args:
+            section: Section identifier
+            parent: Parent widget
+        """
+        if cls._instance is None or cls._instance.parent() is not parent:
+            cls._instance = cls(section, parent)
+        else:
+            cls._instance._load_section(section)
+
+        cls._instance.show()
+        cls._instance.raise_()
+        cls._instance.activateWindow()
+
+
+# ============================================================================
+# HELP CONTENT
+# ============================================================================
+
+# Base CSS for all sections, installed as the document's default stylesheet
+_CSS = """
+    body {
+        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+        line-height: 1.7;
+        color: #333;
+    }
+    h1 {
+        color: #2196F3;
+        border-bottom: 3px solid #2196F3;
+        padding-bottom: 10px;
+        margin-top: 0;
+    }
+    h2 {
+        color: #1976D2;
+        margin-top: 25px;
+    }
+    h3 {
+        color: #0D47A1;
+        margin-top: 20px;
+    }
+    code {
+        background-color: #f5f5f5;
+        padding: 2px 6px;
+        border-radius: 3px;
+        font-family: "Monaco", "Courier New", monospace;
+        font-size: 12px;
+    }
+    .tip {
+        background-color: #E3F2FD;
+        border-left: 4px solid #2196F3;
+        padding: 15px;
+        margin: 15px 0;
+        border-radius: 4px;
+    }
+    .warning {
+        background-color: #FFF3E0;
+        border-left: 4px solid #FF9800;
+        padding: 15px;
+        margin: 15px 0;
+        border-radius: 4px;
+    }
+    .success {
+        background-color: #E8F5E9;
+        border-left: 4px solid #4CAF50;
+        padding: 15px;
+        margin: 15px 0;
+        border-radius: 4px;
+    }
+    ul {
+        line-height: 1.8;
+    }
+    ol {
+        line-height: 1.8;
+    }
+    kbd {
+        background-color: #f5f5f5;
+        border: 1px solid #ccc;
+        border-radius: 3px;
+        padding: 2px 6px;
+        font-family: monospace;
+        font-size: 11px;
+    }
+"""
 
-        if section == "welcome":
-            return (
-                css
-                + """
+# Sections written inline, keyed by section identifier
+_SECTION_BODIES = {
+    "welcome": """
             <h1>Welcome to Prism! 🌟</h1>
 
             <p>Prism is your personal finance and investment management application, designed to help you track your money with ease and clarity.</p>
@@ -309,25 +359,8 @@ class HelpDialog(QDialog):
             <div class="tip">
                 <b>Need More Help?</b> Select a topic from the sidebar to learn about specific features, or check the FAQ section for common questions.
             </div>
-            """
-            )
-
-        elif section == "personal_finances":
-            return css + get_help_text("personal_finances")
-
-        elif section == "investments":
-            return css + get_help_text("investments")
-
-        elif section == "reports":
-            return css + get_help_text("reports")
-
-        elif section == "orders":
-            return css + get_help_text("orders")
-
-        elif section == "logs":
-            return (
-                css
-                + """
+            """,
+    "logs": """
             <h1>Log Viewer 🔍</h1>
 
             <p>The log viewer helps you monitor application activity and troubleshoot issues.</p>
@@ -403,13 +436,8 @@ class HelpDialog(QDialog):
             <div class="warning">
                 <b>⚠️ Clearing Logs:</b> The "Clear Logs" button permanently deletes all log files. This cannot be undone. Use only if you need to free disk space or start fresh.
             </div>
-            """
-            )
-
-        elif section == "settings":
-            return (
-                css
-                + """
+            """,
+    "settings": """
             <h1>Settings & Tips ⚙️</h1>
 
             <h2>Application Preferences</h2>
@@ -509,13 +537,8 @@ class HelpDialog(QDialog):
                 <li>Try selecting different date range</li>
                 <li>Check if chart type requires specific data</li>
             </ul>
-            """
-            )
-
-        elif section == "shortcuts":
-            return (
-                css
-                + """
+            """,
+    "shortcuts": """
             <h1>Keyboard Shortcuts ⌨️</h1>
 
             <p>Speed up your workflow with these keyboard shortcuts.</p>
@@ -594,13 +617,8 @@ class HelpDialog(QDialog):
             <div class="tip">
                 <b>💡 Pro Tip:</b> Hover over buttons and fields to see tooltips with additional shortcuts and help!
             </div>
-            """
-            )
-
-        elif section == "faq":
-            return (
-                css
-                + """
+            """,
+    "faq": """
             <h1>Frequently Asked Questions ❓</h1>
 
             <h2>General</h2>
@@ -703,26 +721,35 @@ class HelpDialog(QDialog):
                 <h3>Still have questions?</h3>
                 <p>Check the sidebar for detailed help on each section, or hover over UI elements for tooltips!</p>
             </div>
-            """
-            )
-
-        else:
-            return (
-                css
-                + """
+            """,
+    "_missing": """
             <h1>Section Not Found</h1>
             <p>This help section is under construction. Please select another topic from the sidebar.</p>
-            """
-            )
+            """,
+}
 
-    @staticmethod
-    def show_help(section: str = "welcome", parent=None):
-        """
-        Show help dialog for a specific section.
+# Runs of whitespace, collapsed before the HTML is handed to Qt
+_WHITESPACE = re.compile(r"\s+")
 
-        Args:
-            section: Section identifier
-            parent: Parent widget
-        """
-        dialog = HelpDialog(section, parent)
-        dialog.exec()
+# Sections documented in tooltips.get_help_text
+_DYNAMIC_SECTIONS = frozenset({"personal_finances", "investments", "reports", "orders"})
+
+
+@functools.lru_cache(maxsize=16)
+def _render_section(section: str) -> str:
+    """
+    Build the HTML for a section the first time it is shown.
+
+    Args:
+        section: Section identifier
+
+    Returns:
+        HTML content string
+    """
+    if section in _DYNAMIC_SECTIONS:
+        html = get_help_text(section)
+    else:
+        html = _SECTION_BODIES.get(section, _SECTION_BODIES["_missing"])
+
+    # Source indentation is insignificant in the help HTML (no <pre> blocks)
+    return _WHITESPACE.sub(" ", html).strip()
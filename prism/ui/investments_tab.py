@@ -3,7 +3,10 @@ Investments tab for Prism application.
 Displays investment portfolio management interface with forms, tables, and charts.
 """
 
+import threading
+import time
 from datetime import datetime
+from functools import partial
 from typing import Optional, List, Dict, Any
 from PyQt6.QtWidgets import (
     QWidget,
@@ -26,7 +29,7 @@ from PyQt6.QtWidgets import (
     QProgressBar,
     QCompleter,
 )
-from PyQt6.QtCore import Qt, QDate, pyqtSignal, QThread, QStringListModel
+from PyQt6.QtCore import Qt, QDate, pyqtSignal, QThread, QStringListModel, QTimer
 from PyQt6.QtGui import QColor, QFont, QKeyEvent
 
 from ..database.db_manager import DatabaseManager
@@ -37,6 +40,20 @@ from ..utils.ticker_data import get_ticker_suggestions, extract_ticker
 from ..utils.config import get_ui_page_size
 from .sell_asset_dialog import SellAssetDialog
 
+# Shared styling for the assets table cells
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_GAIN_COLOR = QColor("#4CAF50")
+_LOSS_COLOR = QColor("#F44336")
+_COLUMN_ALIGNMENTS = (Qt.AlignmentFlag.AlignCenter, None) + (_ALIGN_RIGHT,) * 6
+_ROW_VALUE_KEYS = (
+    "id",
+    "asset_type",
+    "ticker",
+    "quantity",
+    "price_buy",
+    "current_price",
+)
+
 
 class AssetsTable(QTableWidget):
     """Custom QTableWidget with key press event handling."""
@@ -71,10 +88,48 @@ class PriceUpdateWorker(QThread):
         self.db = db_manager
         self.crypto_api = crypto_api
         self.stock_api = stock_api
+        self._last_progress_emit = 0.0
+        # Current prices and historical data are fetched at the same time, so
+        # progress counts finished steps from both: one per asset's history
+        # plus one for saving the current prices
+        self._progress_lock = threading.Lock()
+        self._steps_done = 0
+        self._steps_total = 1
+
+    def _emit_progress(self, value: int, message: str, force: bool = False):
+        """
+        Emit progress, at most every 50 ms unless forced.
+
+        Args:
+            value: Progress percentage
+            message: Progress message
+            force: Emit even if the last update was less than 50 ms ago
+        """
+        now = time.monotonic()
+        if force or now - self._last_progress_emit >= 0.05:
+            self._last_progress_emit = now
+            self.progress.emit(value, message)
+
+    def _advance_progress(self, steps: int, message: str):
+        """
+        Record finished steps and emit the overall progress.
+
+        Args:
+            steps: Number of steps just finished, 0 to only update the message
+            message: Progress message
+        """
+        with self._progress_lock:
+            self._steps_done += steps
+            self._emit_progress(
+                int(self._steps_done * 100 / self._steps_total),
+                message,
+                force=self._steps_done == self._steps_total,
+            )
 
     def run(self):
         """Update prices in background thread with optimized async calls."""
         import asyncio
+        import concurrent.futures
 
         results = {"updated": 0, "failed": 0, "total": 0, "errors": []}
 
@@ -88,42 +143,58 @@ class PriceUpdateWorker(QThread):
                 return
 
             # Group assets by type for batch processing
-            crypto_assets = [a for a in assets if a["asset_type"] == "crypto"]
-            stock_assets = [a for a in assets if a["asset_type"] in ["stock", "bond"]]
+            crypto_assets = []
+            stock_assets = []
+            for asset in assets:
+                if asset["asset_type"] == "crypto":
+                    crypto_assets.append(asset)
+                else:
+                    stock_assets.append(asset)
+
+            self._steps_done = 0
+            self._steps_total = len(assets) + 1
+
+            # Historical data does not depend on the current prices, so it is
+            # fetched in the background while current prices are fetched and
+            # saved; leaving the block waits for it before reporting
+            history_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            with history_executor:
+                history_future = history_executor.submit(
+                    self._fetch_historical_prices_batch, crypto_assets, stock_assets
+                )
 
-            # Update current prices using async batch calls
-            crypto_prices = {}
-            stock_prices = {}
+                # Update current prices using async batch calls
+                crypto_prices = {}
+                stock_prices = {}
 
-            # Run async price fetching
-            asyncio.run(
-                self._fetch_all_prices_async(
-                    crypto_assets, stock_assets, crypto_prices, stock_prices
+                # Run async price fetching
+                asyncio.run(
+                    self._fetch_all_prices_async(
+                        crypto_assets, stock_assets, crypto_prices, stock_prices
+                    )
                 )
-            )
 
-            # Update database with fetched prices
-            for i, asset in enumerate(assets):
-                self.progress.emit(
-                    int((i / len(assets)) * 50), f"Updating {asset['ticker']}..."
-                )
+                # Match fetched prices to assets
+                price_updates = []
+                for asset in assets:
+                    if asset["asset_type"] == "crypto":
+                        price = crypto_prices.get(asset["ticker"])
+                    else:
+                        price = stock_prices.get(asset["ticker"])
 
-                # Update current price
-                price = None
-                if asset["asset_type"] == "crypto":
-                    price = crypto_prices.get(asset["ticker"])
-                elif asset["asset_type"] in ["stock", "bond"]:
-                    price = stock_prices.get(asset["ticker"])
+                    if price:
+                        price_updates.append((asset["id"], price))
+                    else:
+                        results["failed"] += 1
+                        results["errors"].append(asset["ticker"])
 
-                if price:
-                    self.db.update_asset_price(asset["id"], price)
-                    results["updated"] += 1
-                else:
-                    results["failed"] += 1
-                    results["errors"].append(asset["ticker"])
+                # Update database with fetched prices in a single transaction
+                self._advance_progress(0, f"Saving {len(price_updates)} prices...")
+                self.db.update_asset_prices(price_updates)
+                results["updated"] = len(price_updates)
+                self._advance_progress(1, "Prices saved")
 
-            # Fetch historical prices in parallel batches
-            self._fetch_historical_prices_batch(assets, results)
+                history_future.result()
 
             self.progress.emit(100, "Complete")
 
@@ -141,14 +212,17 @@ class PriceUpdateWorker(QThread):
 
         tasks = []
 
+        # Each ticker is fetched once, even when several lots hold it; prices
+        # are matched back to every asset by ticker
+
         # Crypto prices task
         if crypto_assets:
-            crypto_tickers = [a["ticker"] for a in crypto_assets]
+            crypto_tickers = list(dict.fromkeys(a["ticker"] for a in crypto_assets))
             tasks.append(self._fetch_crypto_prices_async(crypto_tickers, crypto_prices))
 
         # Stock prices task
         if stock_assets:
-            stock_tickers = [a["ticker"] for a in stock_assets]
+            stock_tickers = list(dict.fromkeys(a["ticker"] for a in stock_assets))
             tasks.append(self._fetch_stock_prices_async(stock_tickers, stock_prices))
 
         # Run all tasks concurrently
@@ -168,81 +242,90 @@ class PriceUpdateWorker(QThread):
 
     async def _fetch_stock_prices_async(self, tickers, results_dict):
         """Fetch stock prices asynchronously."""
-        try:
-            # Note: Stock API might not have async methods, so we run sync in thread
-            import concurrent.futures
+        import asyncio
 
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(self.stock_api.get_multiple_prices, tickers)
-                prices = future.result(timeout=30)  # 30 second timeout
-                results_dict.update(prices)
+        try:
+            # Stock API has no async methods, so run it in a thread and await it
+            # without blocking the loop, letting the crypto fetch progress too
+            loop = asyncio.get_running_loop()
+            prices = await asyncio.wait_for(
+                loop.run_in_executor(None, self.stock_api.get_multiple_prices, tickers),
+                timeout=30,  # 30 second timeout
+            )
+            results_dict.update(prices)
         except Exception as e:
             print(f"Error fetching stock prices: {e}")
             # Fallback to sync method
             prices = self.stock_api.get_multiple_prices(tickers)
             results_dict.update(prices)
 
-    def _fetch_historical_prices_batch(self, assets, results):
+    def _fetch_historical_prices_batch(self, crypto_assets, stock_assets):
         """Fetch historical prices in optimized batches."""
         import concurrent.futures
 
-        # Group assets by type
-        crypto_assets = [a for a in assets if a["asset_type"] == "crypto"]
-        stock_assets = [a for a in assets if a["asset_type"] in ["stock", "bond"]]
-
-        total_assets = len(assets)
+        total_assets = len(crypto_assets) + len(stock_assets)
         completed = 0
+        historical_rows = []
 
-        # Process crypto historical data
-        if crypto_assets:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                futures = []
-                for asset in crypto_assets:
-                    future = executor.submit(self._fetch_single_historical, asset)
-                    futures.append(future)
-
-                for future in concurrent.futures.as_completed(futures):
-                    completed += 1
-                    self.progress.emit(
-                        50 + int((completed / total_assets) * 50),
-                        f"Fetching historical data... ({completed}/{total_assets})",
-                    )
-                    try:
-                        future.result(timeout=10)  # 10 second timeout per asset
-                    except Exception as e:
-                        print(f"Error fetching historical data: {e}")
+        # One query for what is already stored instead of one per asset
+        last_dates = self.db.get_last_historical_price_dates(
+            [asset["id"] for asset in crypto_assets + stock_assets]
+        )
 
-        # Process stock historical data
-        if stock_assets:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-                futures = []
-                for asset in stock_assets:
-                    future = executor.submit(self._fetch_single_historical, asset)
-                    futures.append(future)
-
-                for future in concurrent.futures.as_completed(futures):
-                    completed += 1
-                    self.progress.emit(
-                        50 + int((completed / total_assets) * 50),
-                        f"Fetching historical data... ({completed}/{total_assets})",
-                    )
-                    try:
-                        future.result(timeout=15)  # 15 second timeout for stocks
-                    except Exception as e:
-                        print(f"Error fetching historical data: {e}")
+        # Crypto and stock historical data come from different providers, so
+        # both pools run at the same time; each keeps its own size to stay
+        # within its provider's rate limits
+        crypto_executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        stock_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        with crypto_executor, stock_executor:
+            # Future -> timeout in seconds
+            futures = {}
+            for asset in crypto_assets:
+                future = crypto_executor.submit(
+                    self._fetch_single_historical, asset, last_dates.get(asset["id"])
+                )
+                futures[future] = 10  # 10 second timeout per asset
+            for asset in stock_assets:
+                future = stock_executor.submit(
+                    self._fetch_single_historical, asset, last_dates.get(asset["id"])
+                )
+                futures[future] = 15  # 15 second timeout for stocks
+
+            for future in concurrent.futures.as_completed(futures):
+                completed += 1
+                self._advance_progress(
+                    1, f"Fetching historical data... ({completed}/{total_assets})"
+                )
+                try:
+                    historical_rows.extend(future.result(timeout=futures[future]))
+                except Exception as e:
+                    print(f"Error fetching historical data: {e}")
 
-    def _fetch_single_historical(self, asset):
-        """Fetch historical prices for a single asset."""
+        # Store everything fetched in a single transaction
+        try:
+            self.db.add_historical_prices_bulk(historical_rows)
+        except Exception as e:
+            print(f"Error saving historical data: {e}")
+
+    def _fetch_single_historical(self, asset, last_date_str):
+        """
+        Fetch historical prices for a single asset.
+
+        Args:
+            asset: Asset dictionary
+            last_date_str: Most recent stored date, or None if there is none
+
+        Returns:
+            List of (asset_id, date, price) rows to store, empty if none
+        """
         try:
-            # Check what data we already have
-            last_date_str = self.db.get_last_historical_price_date(asset["id"])
             days_to_fetch = 365  # Default to 1 year
             if last_date_str:
                 last_date = datetime.strptime(last_date_str, "%Y-%m-%d")
                 days_to_fetch = (datetime.now() - last_date).days
 
             if days_to_fetch <= 1:  # Already up to date
-                return
+                return []
 
             historical_prices = None
             if asset["asset_type"] == "crypto":
@@ -263,15 +346,49 @@ class PriceUpdateWorker(QThread):
                     )
 
             if historical_prices:
-                self.db.add_historical_prices(asset["id"], historical_prices)
+                return [(asset["id"], date, price) for date, price in historical_prices]
 
         except Exception as e:
             print(f"Error fetching historical data for {asset['ticker']}: {e}")
 
+        return []
+
+
+class SinglePriceWorker(QThread):
+    """Worker thread for fetching the current price of one ticker."""
+
+    fetched = pyqtSignal(str, str, object)
+
+    def __init__(self, crypto_api, stock_api, ticker: str, asset_type: str):
+        super().__init__()
+        self.crypto_api = crypto_api
+        self.stock_api = stock_api
+        self.ticker = ticker
+        self.asset_type = asset_type
+
+    def run(self):
+        """Fetch the price in background thread (emits None on failure)."""
+        price = None
+        try:
+            if self.asset_type == "crypto":
+                price = self.crypto_api.get_price_usd(self.ticker)
+            else:
+                price = self.stock_api.get_price(self.ticker)
+        except Exception as e:
+            print(f"Error fetching price for {self.ticker}: {e}")
+
+        self.fetched.emit(self.ticker, self.asset_type, price)
+
 
 class AssetDialog(QDialog):
     """Dialog for adding/editing assets."""
 
+    # Completer models shared across dialogs, keyed by suggestion group
+    _completer_models: Dict[str, QStringListModel] = {}
+
+    # Price workers still running, kept alive even if their dialog is closed
+    _running_price_workers = set()
+
     def __init__(
         self,
         db_manager: DatabaseManager,
@@ -297,6 +414,16 @@ class AssetDialog(QDialog):
         self.asset = asset
         self.is_edit = asset is not None
 
+        # Last suggestion picked from the completer and its ticker
+        self._resolved_suggestion: Optional[str] = None
+        self._resolved_ticker: Optional[str] = None
+
+        # Update the ticker info once typing pauses, not on every keystroke
+        self._ticker_debounce = QTimer(self)
+        self._ticker_debounce.setSingleShot(True)
+        self._ticker_debounce.setInterval(150)
+        self._ticker_debounce.timeout.connect(self._apply_ticker_change)
+
         self.setWindowTitle("Edit Asset" if self.is_edit else "New Asset")
         self.setMinimumWidth(550)
         self._init_ui()
@@ -419,15 +546,8 @@ class AssetDialog(QDialog):
 
     def _setup_ticker_autocomplete(self):
         """Set up autocomplete for ticker field."""
-        # Get all formatted suggestions
-        all_suggestions = []
-        for ticker in self.ticker_suggestions.get_all_tickers():
-            ticker_info = self.ticker_suggestions.get_ticker_info(ticker)
-            formatted = self.ticker_suggestions.format_suggestion(*ticker_info)
-            all_suggestions.append(formatted)
-
-        # Create completer
-        self.completer = QCompleter(all_suggestions)
+        # Create completer over all formatted suggestions
+        self.completer = QCompleter(self._get_completer_model("all"))
         self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.completer.setFilterMode(Qt.MatchFlag.MatchContains)
         self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
@@ -439,31 +559,48 @@ class AssetDialog(QDialog):
         # Handle selection
         self.completer.activated.connect(self._on_suggestion_selected)
 
-    def _on_asset_type_changed(self, asset_type: str):
-        """Handle asset type change to update suggestions."""
-        # Update autocomplete suggestions based on asset type
-        suggestions = []
+    def _get_completer_model(self, group: str) -> QStringListModel:
+        """
+        Get the shared completer model for a suggestion group.
 
-        for ticker in self.ticker_suggestions.get_all_tickers():
-            ticker_type = self.ticker_suggestions.get_asset_type(ticker)
-            # Show all for bonds, filter for crypto/stock
-            if asset_type == "bond" or asset_type == ticker_type:
-                ticker_info = self.ticker_suggestions.get_ticker_info(ticker)
-                formatted = self.ticker_suggestions.format_suggestion(*ticker_info)
-                suggestions.append(formatted)
+        Args:
+            group: "all", "crypto" or "stock"
+
+        Returns:
+            String list model reused by every dialog
+        """
+        model = AssetDialog._completer_models.get(group)
+        if model is None:
+            suggestions = self.ticker_suggestions.get_formatted_list(group)
+            model = QStringListModel(suggestions)
+            AssetDialog._completer_models[group] = model
+        return model
 
-        # Update completer model
-        model = QStringListModel(suggestions)
-        self.completer.setModel(model)
+    def _on_asset_type_changed(self, asset_type: str):
+        """Handle asset type change to update suggestions."""
+        # Show all for bonds, filter for crypto/stock
+        group = "all" if asset_type == "bond" else asset_type
+        self.completer.setModel(self._get_completer_model(group))
 
     def _on_ticker_changed(self, text: str):
-        """Handle ticker text change to show info."""
+        """Handle ticker text change by (re)starting the debounce timer."""
+        self._ticker_debounce.start()
+
+    def _flush_ticker_change(self):
+        """Apply a ticker change still waiting on the debounce timer."""
+        if self._ticker_debounce.isActive():
+            self._ticker_debounce.stop()
+            self._apply_ticker_change()
+
+    def _apply_ticker_change(self):
+        """Show info for the ticker field text and auto-set the asset type."""
+        text = self.ticker_edit.text()
         if not text or self.is_edit:
             self.ticker_info_label.setText("")
             return
 
         # Try to extract ticker if it's a formatted suggestion
-        ticker = extract_ticker(text) if " - " in text else text.strip().upper()
+        ticker = self._parse_ticker(text.strip())
 
         # Get ticker info
         ticker_info = self.ticker_suggestions.get_ticker_info(ticker)
@@ -484,7 +621,10 @@ class AssetDialog(QDialog):
         """Handle when user selects a suggestion."""
         # Extract ticker from formatted suggestion
         ticker = extract_ticker(suggestion)
+        self._resolved_suggestion = suggestion
+        self._resolved_ticker = ticker
         self.ticker_edit.setText(ticker)
+        self._flush_ticker_change()
 
         # Update info label
         ticker_info = self.ticker_suggestions.get_ticker_info(ticker)
@@ -492,8 +632,27 @@ class AssetDialog(QDialog):
             _, name, category = ticker_info
             self.ticker_info_label.setText(f"✅ Selected: {name} • {category}")
 
+    def _parse_ticker(self, text: str) -> str:
+        """
+        Get the ticker symbol from the ticker field text.
+
+        Args:
+            text: Stripped field text, a ticker or a formatted suggestion
+
+        Returns:
+            Ticker symbol
+        """
+        # The field still shows the last selected suggestion
+        if self._resolved_ticker is not None and text in (
+            self._resolved_suggestion,
+            self._resolved_ticker,
+        ):
+            return self._resolved_ticker
+        return extract_ticker(text) if " - " in text else text.upper()
+
     def _on_fetch_price(self):
         """Fetch current price for the ticker."""
+        self._flush_ticker_change()
         ticker_text = self.ticker_edit.text().strip()
         asset_type = self.asset_type_combo.currentText()
 
@@ -503,21 +662,25 @@ class AssetDialog(QDialog):
             return
 
         # Extract ticker if it's a formatted suggestion
-        ticker = (
-            extract_ticker(ticker_text) if " - " in ticker_text else ticker_text.upper()
-        )
+        ticker = self._parse_ticker(ticker_text)
 
         self.price_result_label.setText("⏳ Fetching price...")
         self.price_result_label.setStyleSheet("color: #666;")
         self.fetch_price_btn.setEnabled(False)
 
-        # Fetch price based on type
-        price = None
-        if asset_type == "crypto":
-            price = self.crypto_api.get_price_usd(ticker)
-        else:
-            price = self.stock_api.get_price(ticker)
+        # Fetch price based on type without blocking the dialog
+        self._price_worker = SinglePriceWorker(
+            self.crypto_api, self.stock_api, ticker, asset_type
+        )
+        self._price_worker.fetched.connect(self._on_price_fetched)
+        AssetDialog._running_price_workers.add(self._price_worker)
+        self._price_worker.finished.connect(
+            partial(AssetDialog._running_price_workers.discard, self._price_worker)
+        )
+        self._price_worker.start()
 
+    def _on_price_fetched(self, ticker: str, asset_type: str, price):
+        """Show the result of a background price fetch."""
         self.fetch_price_btn.setEnabled(True)
 
         if price:
@@ -535,6 +698,9 @@ class AssetDialog(QDialog):
 
     def _on_accept(self):
         """Validate and accept dialog."""
+        # Make sure the asset type follows the ticker that was just typed
+        self._flush_ticker_change()
+
         # Validate ticker - extract from suggestion if needed
         ticker_text = self.ticker_edit.text().strip()
         if not ticker_text:
@@ -543,9 +709,7 @@ class AssetDialog(QDialog):
             return
 
         # Extract ticker if it's a formatted suggestion
-        ticker = (
-            extract_ticker(ticker_text) if " - " in ticker_text else ticker_text.upper()
-        )
+        ticker = self._parse_ticker(ticker_text)
 
         # Validate quantity
         try:
@@ -593,9 +757,7 @@ class AssetDialog(QDialog):
         price_currency = "USD" if asset_type == "crypto" else "EUR"
 
         ticker_text = self.ticker_edit.text().strip()
-        ticker = (
-            extract_ticker(ticker_text) if " - " in ticker_text else ticker_text.upper()
-        )
+        ticker = self._parse_ticker(ticker_text)
 
         return {
             "ticker": ticker,
@@ -635,6 +797,16 @@ class InvestmentsTab(QWidget):
         self.stock_api = stock_api
         self.trading = TradingManager(db_manager)
         self.price_worker = None
+        self._row_by_id: Dict[int, int] = {}
+        self._row_values: List[tuple] = []
+
+        # Coalesce reloads requested while handling the same event, such as
+        # a change here and the refresh() it triggers through data_changed
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(0)
+        self._reload_timer.timeout.connect(self._load_data)
+
         self._init_ui()
         self._load_data()
 
@@ -797,6 +969,7 @@ class InvestmentsTab(QWidget):
         # Value
         value_label = QLabel(value)
         value_label.setObjectName("card_value")
+        value_label.setProperty("value_color", color)
         value_label.setStyleSheet(
             f"font-size: 24px; font-weight: bold; color: {color};"
         )
@@ -897,11 +1070,11 @@ class InvestmentsTab(QWidget):
         """Load data from database and update UI."""
         try:
             # Get portfolio metrics
-            portfolio_value = self.db.get_portfolio_value()
-            portfolio_summary = self.db.get_portfolio_summary()
+            snapshot = self.db.get_portfolio_snapshot()
 
-            total_cost = portfolio_summary.get("total_cost", 0)
-            total_gain = portfolio_summary.get("total_gain", 0)
+            portfolio_value = snapshot["total_value"]
+            total_cost = snapshot["total_cost"]
+            total_gain = snapshot["total_gain"]
 
             self._update_card_value(self.portfolio_card, f"€{portfolio_value:,.2f}")
             self._update_card_value(self.cost_card, f"€{total_cost:,.2f}")
@@ -914,7 +1087,7 @@ class InvestmentsTab(QWidget):
             )
 
             # Get total asset count
-            self.total_assets = self.db.get_asset_count()
+            self.total_assets = snapshot["asset_count"]
             self._update_card_value(self.count_card, str(self.total_assets))
 
             # Update pagination controls
@@ -935,19 +1108,28 @@ class InvestmentsTab(QWidget):
         value_label = card.findChild(QLabel, "card_value")
         if value_label:
             value_label.setText(value)
-            if color:
+            # Restyling re-polishes the label, so only do it when the color changes
+            if color and value_label.property("value_color") != color:
+                value_label.setProperty("value_color", color)
                 # Update with full style to ensure font-size is preserved
                 value_label.setStyleSheet(
                     f"font-size: 24px; font-weight: bold; color: {color};"
                 )
 
+    def _schedule_reload(self):
+        """Reload the tab data once the current event has been handled."""
+        self._reload_timer.start()
+
     def _load_assets_page(self):
         """Load assets for current page."""
+        # Sorted by value (highest first) across all pages
         if self.page_size == 0:  # Show all
-            assets = self.db.get_all_assets()
+            assets = self.db.get_all_assets(order_by_value=True)
         else:
             offset = self.current_page * self.page_size
-            assets = self.db.get_all_assets(limit=self.page_size, offset=offset)
+            assets = self.db.get_all_assets(
+                limit=self.page_size, offset=offset, order_by_value=True
+            )
 
         self._populate_table(assets)
 
@@ -1009,101 +1191,161 @@ class InvestmentsTab(QWidget):
         self._load_assets_page()
         self._update_pagination_controls()
 
-    def _populate_table(self, assets: List[Dict[str, Any]]):
-        """Populate assets table with data."""
-        self.assets_table.setRowCount(0)
+    def _populate_table(self, assets_sorted: List[Dict[str, Any]]):
+        """
+        Populate assets table with data.
 
-        # Sort by value (highest first)
-        assets_sorted = sorted(
-            assets,
-            key=lambda x: x.get("quantity", 0) * (x.get("current_price") or 0),
-            reverse=True,
-        )
+        Args:
+            assets_sorted: Assets in display order (by value, highest first)
+        """
+        # The values every cell is formatted from; unchanged values mean
+        # there is nothing to redraw
+        row_values = [
+            tuple(asset.get(key) for key in _ROW_VALUE_KEYS) for asset in assets_sorted
+        ]
+        if row_values == self._row_values:
+            return
+
+        row_by_id = {asset["id"]: row for row, asset in enumerate(assets_sorted)}
+        if row_by_id == self._row_by_id:
+            # Same assets in the same rows (e.g. after a price refresh): only
+            # touch the cells that changed and keep the action widgets
+            self._apply_updates(assets_sorted)
+        else:
+            self._initial_populate(assets_sorted)
+            self._row_by_id = row_by_id
+        self._row_values = row_values
+
+    def _initial_populate(self, assets_sorted: List[Dict[str, Any]]):
+        """
+        Rebuild every row of the assets table.
+
+        Args:
+            assets_sorted: Assets in display order
+        """
+        table = self.assets_table
+        header = table.horizontalHeader()
+
+        # Fonts shared by every row
+        ticker_font = QFont("Monospace", 10, QFont.Weight.Bold)
+        value_font = QFont("", -1, QFont.Weight.Bold)
+        column_fonts = {1: ticker_font, 5: value_font}
+
+        # Fill with repaints and column auto-sizing suspended, then size the
+        # columns once at the end
+        table.setUpdatesEnabled(False)
+        for column in range(table.columnCount()):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(assets_sorted))
+
+            for row, asset in enumerate(assets_sorted):
+                for column, (text, color) in enumerate(self._format_asset_row(asset)):
+                    item = QTableWidgetItem(text)
+                    alignment = _COLUMN_ALIGNMENTS[column]
+                    if alignment is not None:
+                        item.setTextAlignment(alignment)
+                    if column in column_fonts:
+                        item.setFont(column_fonts[column])
+                    if color is not None:
+                        item.setForeground(color)
+                    if column == 0:
+                        # Store asset ID for bulk delete
+                        item.setData(Qt.ItemDataRole.UserRole, asset["id"])
+                    table.setItem(row, column, item)
+
+                # Actions
+                actions_widget = self._create_action_buttons(asset["id"])
+                table.setCellWidget(row, 8, actions_widget)
+        finally:
+            self._restore_table_sizing()
+
+    def _restore_table_sizing(self):
+        """Re-enable column auto-sizing and repaints after a bulk table edit."""
+        table = self.assets_table
+        header = table.horizontalHeader()
+        for column in range(table.columnCount()):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        table.setUpdatesEnabled(True)
+
+    def _apply_updates(self, assets_sorted: List[Dict[str, Any]]):
+        """
+        Update the cells whose text or color changed, in place.
+
+        Args:
+            assets_sorted: Assets in the order they are already displayed
+        """
+        table = self.assets_table
+        header = table.horizontalHeader()
 
+        changes = []
         for asset in assets_sorted:
-            row = self.assets_table.rowCount()
-            self.assets_table.insertRow(row)
-
-            # Type
-            type_item = QTableWidgetItem(asset.get("asset_type", "").upper())
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            type_item.setData(
-                Qt.ItemDataRole.UserRole, asset["id"]
-            )  # Store asset ID for bulk delete
-            self.assets_table.setItem(row, 0, type_item)
-
-            # Ticker
-            ticker_item = QTableWidgetItem(asset.get("ticker", ""))
-            ticker_item.setFont(QFont("Monospace", 10, QFont.Weight.Bold))
-            self.assets_table.setItem(row, 1, ticker_item)
-
-            # Quantity
-            quantity = asset.get("quantity", 0)
-            quantity_item = QTableWidgetItem(f"{quantity:,.4f}".rstrip("0").rstrip("."))
-            quantity_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            self.assets_table.setItem(row, 2, quantity_item)
+            row = self._row_by_id[asset["id"]]
+            for column, (text, color) in enumerate(self._format_asset_row(asset)):
+                item = table.item(row, column)
+                if item.text() != text or (
+                    color is not None and item.foreground().color() != color
+                ):
+                    changes.append((item, text, color))
+
+        if not changes:
+            return
 
-            # Buy Price - show $ for crypto, € for stocks
-            buy_price = asset.get("price_buy") or 0
-            asset_type = asset.get("asset_type", "")
-            currency_symbol = "$" if asset_type == "crypto" else "€"
-            buy_price_item = QTableWidgetItem(f"{currency_symbol}{buy_price:,.2f}")
-            buy_price_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            self.assets_table.setItem(row, 3, buy_price_item)
+        # Same as a full fill: resize the columns once, not per edited cell
+        table.setUpdatesEnabled(False)
+        for column in range(table.columnCount()):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
 
-            # Current Price - show $ for crypto, € for stocks
-            current_price = asset.get("current_price") or 0
-            current_price_item = QTableWidgetItem(
-                f"{currency_symbol}{current_price:,.2f}"
-            )
-            current_price_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            self.assets_table.setItem(row, 4, current_price_item)
+        try:
+            for item, text, color in changes:
+                item.setText(text)
+                if color is not None:
+                    item.setForeground(color)
+        finally:
+            self._restore_table_sizing()
+
+    def _format_asset_row(self, asset: Dict[str, Any]) -> List[tuple]:
+        """
+        Format the cells of an asset row.
 
-            # Current Value
-            value = quantity * current_price
-            value_item = QTableWidgetItem(f"€{value:,.2f}")
-            value_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            value_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            self.assets_table.setItem(row, 5, value_item)
-
-            # Gain/Loss
-            cost = quantity * buy_price
-            gain = value - cost
-            gain_item = QTableWidgetItem(f"{'+' if gain >= 0 else ''}€{gain:,.2f}")
-            gain_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            gain_item.setForeground(QColor("#4CAF50" if gain >= 0 else "#F44336"))
-            self.assets_table.setItem(row, 6, gain_item)
+        Args:
+            asset: Asset dictionary
 
-            # Gain %
-            gain_pct = (
-                ((current_price - buy_price) / buy_price * 100) if buy_price > 0 else 0
-            )
-            gain_pct_item = QTableWidgetItem(
-                f"{'+' if gain_pct >= 0 else ''}{gain_pct:.2f}%"
-            )
-            gain_pct_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            gain_pct_item.setForeground(
-                QColor("#4CAF50" if gain_pct >= 0 else "#F44336")
-            )
-            self.assets_table.setItem(row, 7, gain_pct_item)
+        Returns:
+            (text, foreground color or None) for each data column
+        """
+        quantity = asset.get("quantity", 0)
+        buy_price = asset.get("price_buy") or 0
+        current_price = asset.get("current_price") or 0
 
-            # Actions
-            actions_widget = self._create_action_buttons(asset)
-            self.assets_table.setCellWidget(row, 8, actions_widget)
+        # Prices are in $ for crypto, € for stocks
+        currency_symbol = "$" if asset.get("asset_type", "") == "crypto" else "€"
 
-    def _create_action_buttons(self, asset: Dict[str, Any]) -> QWidget:
+        value = quantity * current_price
+        gain = value - quantity * buy_price
+        gain_pct = (
+            ((current_price - buy_price) / buy_price * 100) if buy_price > 0 else 0
+        )
+
+        return [
+            (asset.get("asset_type", "").upper(), None),
+            (asset.get("ticker", ""), None),
+            (f"{quantity:,.4f}".rstrip("0").rstrip("."), None),
+            (f"{currency_symbol}{buy_price:,.2f}", None),
+            (f"{currency_symbol}{current_price:,.2f}", None),
+            (f"€{value:,.2f}", None),
+            (
+                f"{'+' if gain >= 0 else ''}€{gain:,.2f}",
+                _GAIN_COLOR if gain >= 0 else _LOSS_COLOR,
+            ),
+            (
+                f"{'+' if gain_pct >= 0 else ''}{gain_pct:.2f}%",
+                _GAIN_COLOR if gain_pct >= 0 else _LOSS_COLOR,
+            ),
+        ]
+
+    def _create_action_buttons(self, asset_id: int) -> QWidget:
         """Create action buttons for an asset row."""
         widget = QWidget()
         layout = QHBoxLayout(widget)
@@ -1117,7 +1359,7 @@ class InvestmentsTab(QWidget):
         edit_btn.setMaximumWidth(85)
         edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         edit_btn.setToolTip("Edit this asset")
-        edit_btn.clicked.connect(lambda: self._on_edit_asset(asset))
+        edit_btn.clicked.connect(partial(self._on_edit_asset_by_id, asset_id))
         layout.addWidget(edit_btn)
 
         # Delete button
@@ -1127,7 +1369,7 @@ class InvestmentsTab(QWidget):
         delete_btn.setMaximumWidth(95)
         delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         delete_btn.setToolTip("Delete this asset")
-        delete_btn.clicked.connect(lambda: self._on_delete_asset(asset))
+        delete_btn.clicked.connect(partial(self._on_delete_asset_by_id, asset_id))
         layout.addWidget(delete_btn)
 
         return widget
@@ -1168,12 +1410,30 @@ class InvestmentsTab(QWidget):
                     current_price=current_price,
                     asset_type=data["asset_type"],
                 )
-                self._load_data()
+                self._schedule_reload()
                 self.data_changed.emit()
                 QMessageBox.information(self, "Success", "Asset added successfully!")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to add asset:\n{str(e)}")
 
+    def _on_edit_asset_by_id(self, asset_id: int):
+        """Edit an asset from its row button, using its current data."""
+        asset = self.db.get_asset(asset_id)
+        if asset is None:
+            # Removed since the table was loaded
+            self._schedule_reload()
+            return
+        self._on_edit_asset(asset)
+
+    def _on_delete_asset_by_id(self, asset_id: int):
+        """Delete an asset from its row button, using its current data."""
+        asset = self.db.get_asset(asset_id)
+        if asset is None:
+            # Removed since the table was loaded
+            self._schedule_reload()
+            return
+        self._on_delete_asset(asset)
+
     def _on_edit_asset(self, asset: Dict[str, Any]):
         """Handle edit asset."""
         dialog = AssetDialog(
@@ -1200,7 +1460,7 @@ class InvestmentsTab(QWidget):
                     if current_price
                     else asset.get("current_price"),
                 )
-                self._load_data()
+                self._schedule_reload()
                 self.data_changed.emit()
                 QMessageBox.information(self, "Success", "Asset updated successfully!")
             except Exception as e:
@@ -1223,7 +1483,7 @@ class InvestmentsTab(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.db.delete_asset(asset["id"])
-                self._load_data()
+                self._schedule_reload()
                 self.data_changed.emit()
                 QMessageBox.information(self, "Success", "Asset deleted successfully!")
             except Exception as e:
@@ -1286,7 +1546,7 @@ class InvestmentsTab(QWidget):
                     failed_count += 1
                     print(f"Failed to delete asset {asset['id']}: {e}")
 
-            self._load_data()
+            self._schedule_reload()
             self.data_changed.emit()
 
             if failed_count == 0:
@@ -1322,10 +1582,13 @@ class InvestmentsTab(QWidget):
         self.refresh_prices_btn.setEnabled(False)
         self.add_btn.setEnabled(False)
 
-        # Create and start worker thread
-        self.price_worker = PriceUpdateWorker(self.db, self.crypto_api, self.stock_api)
-        self.price_worker.progress.connect(self._on_price_update_progress)
-        self.price_worker.finished.connect(self._on_price_update_finished)
+        # Create the worker thread once and restart it for later refreshes
+        if self.price_worker is None:
+            self.price_worker = PriceUpdateWorker(
+                self.db, self.crypto_api, self.stock_api
+            )
+            self.price_worker.progress.connect(self._on_price_update_progress)
+            self.price_worker.finished.connect(self._on_price_update_finished)
         self.price_worker.start()
 
     def _on_price_update_progress(self, value: int, message: str):
@@ -1342,10 +1605,43 @@ class InvestmentsTab(QWidget):
         self.refresh_prices_btn.setEnabled(True)
         self.add_btn.setEnabled(True)
 
+        total = results.get("total", 0)
+        updated = results.get("updated", 0)
+        failed = results.get("failed", 0)
+        errors = results.get("errors", [])
+
+        # The worker failed before it counted any assets
+        if total == 0 and errors:
+            QMessageBox.critical(
+                self, "Error", "Failed to update prices:\n" + "\n".join(errors)
+            )
+            return
+
+        # Nothing was fetched (empty portfolio), so nothing to reload
+        if total == 0:
+            QMessageBox.information(
+                self, "No Assets", "No assets found to update prices."
+            )
+            return
+
         # Reload data
-        self._load_data()
+        self._schedule_reload()
         self.data_changed.emit()
 
+        # Show results
+        lines = [
+            "Price update complete!",
+            "",
+            f"Total assets: {total}",
+            f"Successfully updated: {updated}",
+        ]
+        if failed > 0:
+            lines.append(f"Failed to update: {failed}")
+            if errors:
+                lines.append(f"Failed tickers: {', '.join(errors)}")
+
+        QMessageBox.information(self, "Prices Updated", "\n".join(lines))
+
     def refresh(self):
         """Public method to refresh the tab data."""
         self.current_page = 0  # Reset to first page on refresh
@@ -1406,7 +1702,7 @@ class InvestmentsTab(QWidget):
                             )
 
                             # Refresh the data
-                            self._load_data()
+                            self._schedule_reload()
                             self.data_changed.emit()
                         else:
                             # Show error
@@ -1422,27 +1718,6 @@ class InvestmentsTab(QWidget):
                             f"An error occurred while processing the sale:\n\n{str(e)}",
                         )
 
-        # Show results
-        total = results.get("total", 0)
-        updated = results.get("updated", 0)
-        failed = results.get("failed", 0)
-        errors = results.get("errors", [])
-
-        if total == 0:
-            QMessageBox.information(
-                self, "No Assets", "No assets found to update prices."
-            )
-        else:
-            message = f"Price update complete!\n\n"
-            message += f"Total assets: {total}\n"
-            message += f"Successfully updated: {updated}\n"
-            if failed > 0:
-                message += f"Failed to update: {failed}\n"
-                if errors:
-                    message += f"Failed tickers: {', '.join(errors)}"
-
-            QMessageBox.information(self, "Prices Updated", message)
-
     def refresh(self):
         """Public method to refresh the tab data."""
-        self._load_data()
+        self._schedule_reload()
@@ -3,11 +3,20 @@ Category Manager for Prism application.
 Manages custom categories, budget limits, and category analytics.
 """
 
-from typing import List, Dict, Optional, Any
+import sqlite3
+from calendar import monthrange
+from datetime import date
+from typing import List, Dict, Optional, Any, Tuple
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Names of categories referenced by transactions or recurring transactions
+_IN_USE_NAMES_QUERY = (
+    "SELECT category FROM transactions "
+    "UNION SELECT category FROM recurring_transactions"
+)
+
 
 class CategoryManager:
     """Manages custom categories and their properties."""
@@ -78,8 +87,17 @@ class CategoryManager:
 
             return category_id
 
+        except sqlite3.IntegrityError as e:
+            # Duplicate names are an expected user error, reported by the caller
+            logger.warning(f"Category not added: {str(e)}")
+            # A failed INSERT leaves the implicit transaction open, which would
+            # keep the write lock and block every other connection
+            self.db_manager.conn.rollback()
+            raise
+
         except Exception as e:
             logger.error(f"Failed to add category: {str(e)}")
+            self.db_manager.conn.rollback()
             raise
 
     def get_all_categories(
@@ -109,6 +127,51 @@ class CategoryManager:
 
         return categories
 
+    def get_category_columns(
+        self, category_type: Optional[str] = None, include_in_use: bool = False
+    ) -> Dict[str, List[Any]]:
+        """
+        Get all categories as parallel column lists.
+
+        Uses the same filtering and ordering as get_all_categories, but
+        returns one list per column instead of one dictionary per row,
+        which is cheaper to build and to index from table models.
+
+        Args:
+            category_type: Optional filter ('income', 'expense', or None for all)
+            include_in_use: Also derive an 'in_use' column in the same query,
+                True where transactions or recurring transactions use the category
+
+        Returns:
+            Dictionary mapping 'id', 'name', 'type', 'color', 'icon',
+            'budget_limit' (and optionally 'in_use') to lists of equal length
+        """
+        columns = ["id", "name", "type", "color", "icon", "budget_limit"]
+        select = "SELECT id, name, type, color, icon, budget_limit"
+
+        if include_in_use:
+            columns.append("in_use")
+            select += f", name IN ({_IN_USE_NAMES_QUERY}) AS in_use"
+
+        select += " FROM categories"
+
+        if category_type:
+            query = f"{select} WHERE type = ? ORDER BY name ASC"
+            cursor = self.db_manager.conn.execute(query, (category_type,))
+        else:
+            query = f"{select} ORDER BY type ASC, name ASC"
+            cursor = self.db_manager.conn.execute(query)
+
+        rows = cursor.fetchall()
+        if not rows:
+            return {column: [] for column in columns}
+
+        result = {column: list(values) for column, values in zip(columns, zip(*rows))}
+        if include_in_use:
+            result["in_use"] = [bool(flag) for flag in result["in_use"]]
+
+        return result
+
     def get_category(self, category_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a specific category by ID.
@@ -253,6 +316,22 @@ class CategoryManager:
 
         return count > 0
 
+    def get_data_version(self) -> Tuple[int, int]:
+        """
+        Get a cheap token that changes whenever the database is modified.
+
+        Combines SQLite's data_version pragma, which changes when another
+        connection commits, with the number of rows changed through the
+        shared connection. Both are O(1), so callers can use the token to
+        decide whether cached query results are still valid.
+
+        Returns:
+            Tuple of (data_version, total_changes)
+        """
+        conn = self.db_manager.conn
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return (data_version, conn.total_changes)
+
     def get_category_statistics(
         self,
         category_name: str,
@@ -323,6 +402,38 @@ class CategoryManager:
 
         return stats
 
+    def get_monthly_totals(
+        self,
+        start_date: str,
+        end_date: str,
+        category_type: str = "expense",
+    ) -> Dict[str, float]:
+        """
+        Get the summed transaction amount per category over a date range.
+
+        Aggregates all categories in a single GROUP BY query instead of
+        calling get_category_statistics once per category.
+
+        Args:
+            start_date: Start date (YYYY-MM-DD, inclusive)
+            end_date: End date (YYYY-MM-DD, inclusive)
+            category_type: Category type to include ('income' or 'expense')
+
+        Returns:
+            Dictionary mapping category name to total amount
+        """
+        query = """
+            SELECT c.name, SUM(t.amount)
+            FROM transactions t
+            JOIN categories c ON t.category = c.name
+            WHERE t.date BETWEEN ? AND ? AND c.type = ?
+            GROUP BY c.name
+        """
+        cursor = self.db_manager.conn.execute(
+            query, (start_date, end_date, category_type)
+        )
+        return {name: total for name, total in cursor.fetchall()}
+
     def get_all_category_statistics(
         self, start_date: Optional[str] = None, end_date: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -358,32 +469,18 @@ class CategoryManager:
         alerts = []
 
         # Get current month date range
-        from datetime import datetime
-
-        now = datetime.now()
-        start_date = f"{now.year:04d}-{now.month:02d}-01"
-
-        # Calculate last day of month
-        if now.month == 12:
-            next_month = datetime(now.year + 1, 1, 1)
-        else:
-            next_month = datetime(now.year, now.month + 1, 1)
-
-        from datetime import timedelta
-
-        last_day = (next_month - timedelta(days=1)).day
-        end_date = f"{now.year:04d}-{now.month:02d}-{last_day:02d}"
+        today = date.today()
+        last_day = monthrange(today.year, today.month)[1]
+        start_date = f"{today.year:04d}-{today.month:02d}-01"
+        end_date = f"{today.year:04d}-{today.month:02d}-{last_day:02d}"
 
         # Get expense categories with budget limits
         categories = self.get_all_categories(category_type="expense")
+        totals = self.get_monthly_totals(start_date, end_date, "expense")
 
         for category in categories:
             if category["budget_limit"] and category["budget_limit"] > 0:
-                stats = self.get_category_statistics(
-                    category["name"], start_date, end_date
-                )
-
-                spent = abs(stats["total_amount"])
+                spent = abs(round(totals.get(category["name"], 0.0), 2))
                 budget = category["budget_limit"]
                 usage_percent = (spent / budget * 100) if budget > 0 else 0
 
@@ -21,6 +21,9 @@ class DatabaseConfig:
     default_page_size: int = 50
     max_page_size: int = 1000
 
+    # Rows written per transaction during CSV imports
+    import_batch_size: int = 1000
+
     # Performance settings
     enable_query_logging: bool = False
     enable_performance_monitoring: bool = True
@@ -147,6 +150,12 @@ class ConfigManager:
             os.getenv("PRISM_DB_MAX_CONNECTIONS", self._config.database.max_connections)
         )
 
+        self._config.database.import_batch_size = int(
+            os.getenv(
+                "PRISM_IMPORT_BATCH_SIZE", self._config.database.import_batch_size
+            )
+        )
+
         # API settings
         self._config.api.request_timeout = float(
             os.getenv("PRISM_API_TIMEOUT", self._config.api.request_timeout)
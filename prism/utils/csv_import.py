@@ -5,8 +5,9 @@ Handles importing transactions from CSV files with validation and error handling
 
 import csv
 import os
+import sqlite3
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Iterator
 from pathlib import Path
 from ..utils.logger import get_logger
 
@@ -33,6 +34,9 @@ class CSVImporter:
         "%m-%d-%Y",
     ]
 
+    # Read buffer for imports, larger than the 8 KiB default to cut read calls
+    READ_BUFFER_SIZE = 1 << 20
+
     # BoursoBank CSV format mapping
     BOURSO_BANK_MAPPING = {
         "dateop": "date",  # Operation date
@@ -43,6 +47,31 @@ class CSVImporter:
         "comment": "description",  # Comment (additional description)
     }
 
+    # Map common BoursoBank categories to standard ones
+    BOURSO_BANK_CATEGORY_MAPPING = {
+        "Alimentation": "Food",
+        "Transports longue distance (avions, trains…)": "Transport",
+        "Virements reçus": "Income",
+        "Virements émis": "Transfer",
+        "Téléphonie (fixe et mobile)": "Utilities",
+        "Restaurants, bars, discothèques…": "Entertainment",
+        "Laverie, Pressing …": "Household",
+        "Pharmacie et laboratoire": "Healthcare",
+        "Vêtements et accessoires": "Shopping",
+        "Energie (électricité, gaz, fuel, chauffage…)": "Utilities",
+        "Impôts & Taxes - Autres": "Taxes",
+        "Allocations familiales": "Income",
+        "Dépôts (cartes/chèques/espèces)": "Income",
+        "Péages": "Transport",
+        "Carburant": "Transport",
+        "Hébergement (hôtels, camping…)": "Travel",
+        "Equipements sportifs et artistiques": "Sports",
+        "Dons et Cadeaux": "Charity",
+        "Logement - Autres": "Housing",
+        "Revenus épargne financière (retraite, prévoyance, PEA, assurance-vie…)": "Investment",
+        "Vie Quotidienne - Autres": "Other",
+    }
+
     def __init__(self, db_manager):
         """
         Initialize CSV importer.
@@ -53,6 +82,9 @@ class CSVImporter:
         self.db_manager = db_manager
         self.is_boursobank_format = False
 
+        # Files that passed validation: path -> (signature, is_boursobank_format)
+        self._validated_files = {}
+
     def validate_csv_file(self, file_path: str) -> Tuple[bool, str]:
         """
         Validate CSV file structure and accessibility.
@@ -79,6 +111,9 @@ class CSVImporter:
         if os.path.getsize(file_path) == 0:
             return False, "File is empty"
 
+        # Format is detected per file
+        self.is_boursobank_format = False
+
         # Try to read and validate headers
         try:
             # First try with comma separator
@@ -133,6 +168,11 @@ class CSVImporter:
                             f"Missing required columns: {', '.join(missing_fields)}",
                         )
 
+            # Remember the result so the import can skip validating again
+            self._validated_files[file_path] = (
+                self._file_signature(file_path),
+                self.is_boursobank_format,
+            )
             return True, ""
 
         except UnicodeDecodeError:
@@ -142,6 +182,38 @@ class CSVImporter:
         except Exception as e:
             return False, f"Unexpected error: {str(e)}"
 
+    @staticmethod
+    def _file_signature(file_path: str) -> Tuple[int, int]:
+        """Get a file's (modification time in ns, size) to detect changes."""
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _restore_validation(self, file_path: str) -> bool:
+        """
+        Reuse an earlier successful validation of an unchanged file.
+
+        Args:
+            file_path: Path to CSV file
+
+        Returns:
+            True if the file was validated and is unchanged, in which case
+            the detected format is restored
+        """
+        cached = self._validated_files.get(file_path)
+        if cached is None:
+            return False
+
+        try:
+            signature = self._file_signature(file_path)
+        except OSError:
+            return False
+
+        if signature != cached[0]:
+            return False
+
+        self.is_boursobank_format = cached[1]
+        return True
+
     def parse_date(self, date_str: str) -> Optional[str]:
         """
         Parse date string in various formats.
@@ -163,6 +235,38 @@ class CSVImporter:
 
         return None
 
+    def parse_dates(self, date_strs: List[str]) -> List[Optional[str]]:
+        """
+        Parse many date strings at once.
+
+        Each of DATE_FORMATS is applied to all still-unparsed values in one
+        vectorized pass, in the same order parse_date tries them.
+
+        Args:
+            date_strs: Date strings to parse
+
+        Returns:
+            Dates in YYYY-MM-DD format, None where parsing fails
+        """
+        # Imported here so pandas is only loaded once an import actually runs
+        import pandas as pd
+
+        dates = pd.Series(date_strs, dtype=object).str.strip()
+        parsed = pd.Series(None, index=dates.index, dtype=object)
+
+        for date_format in self.DATE_FORMATS:
+            pending = parsed.isna()
+            if not pending.any():
+                break
+
+            converted = pd.to_datetime(
+                dates[pending], format=date_format, errors="coerce"
+            ).dropna()
+            if not converted.empty:
+                parsed[converted.index] = converted.dt.strftime("%Y-%m-%d")
+
+        return parsed.where(parsed.notna(), None).tolist()
+
     def parse_amount(self, amount_str: str) -> Optional[float]:
         """
         Parse amount string, handling various formats including French decimal format.
@@ -211,11 +315,300 @@ class CSVImporter:
         # Capitalize first letter of each word
         return category.strip().title()
 
+    def iter_batches(
+        self, file_path: str, chunk_size: int
+    ) -> Iterator[List[Tuple[int, Dict[str, str]]]]:
+        """
+        Read CSV rows in fixed-size batches.
+
+        The file must have been validated first so the delimiter is known.
+
+        Args:
+            file_path: Path to CSV file
+            chunk_size: Maximum number of rows per batch
+
+        Yields:
+            Lists of (row_number, row) tuples with normalized headers
+        """
+        with open(
+            file_path, "r", encoding="utf-8-sig", buffering=self.READ_BUFFER_SIZE
+        ) as f:
+            # Use appropriate delimiter based on format detection
+            delimiter = ";" if self.is_boursobank_format else ","
+            reader = csv.DictReader(f, delimiter=delimiter)
+
+            # Normalize headers
+            reader.fieldnames = [h.lower().strip() for h in reader.fieldnames]
+
+            batch = []
+            for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
+                batch.append((row_num, row))
+                if len(batch) >= chunk_size:
+                    yield batch
+                    batch = []
+
+            if batch:
+                yield batch
+
+    def _map_boursobank_row(self, row: Dict[str, str]) -> Dict[str, str]:
+        """
+        Map a BoursoBank row to the standard column names.
+
+        Args:
+            row: Raw BoursoBank CSV row
+
+        Returns:
+            Row using the standard date/amount/category/description columns
+        """
+        mapped_row = {}
+        for key, value in row.items():
+            # Map BoursoBank column names to standard names
+            if key in self.BOURSO_BANK_MAPPING:
+                mapped_key = self.BOURSO_BANK_MAPPING[key]
+                mapped_row[mapped_key] = value
+            else:
+                mapped_row[key] = value
+
+        # For BoursoBank, use dateOp first, then dateVal as fallback
+        if not mapped_row.get("date"):
+            mapped_row["date"] = row.get("dateval") or ""
+
+        # Combine label and comment for description
+        label = (row.get("label") or "").strip()
+        comment = (row.get("comment") or "").strip()
+        if label and comment:
+            mapped_row["description"] = f"{label} - {comment}"
+        elif label:
+            mapped_row["description"] = label
+        elif comment:
+            mapped_row["description"] = comment
+
+        # Map BoursoBank categories to standard categories
+        category = (row.get("category") or "").strip()
+        if category:
+            mapped_row["category"] = self.BOURSO_BANK_CATEGORY_MAPPING.get(
+                category, category
+            )
+
+        return mapped_row
+
+    @staticmethod
+    def _date_field(row: Dict[str, str]) -> str:
+        """Get the stripped raw date of a row, empty if missing."""
+        return (row.get("date") or "").strip()
+
+    def _parse_row(
+        self, row: Dict[str, str], default_type: str, date: Optional[str]
+    ) -> Tuple[str, float, str, str, str]:
+        """
+        Parse and validate a single CSV row.
+
+        Args:
+            row: CSV row with normalized headers, mapped for BoursoBank files
+            default_type: Default transaction type if not specified
+            date: The row's date as returned by parse_dates
+
+        Returns:
+            Tuple of (date, amount, category, type, description)
+
+        Raises:
+            ValueError: If a required field is missing or invalid
+        """
+        # Check date
+        date_str = self._date_field(row)
+        if not date_str:
+            raise ValueError("Missing date")
+
+        if not date:
+            raise ValueError(
+                f"Invalid date format '{date_str}'. "
+                f"Expected formats: YYYY-MM-DD, DD/MM/YYYY, etc."
+            )
+
+        # Parse amount
+        amount_str = row.get("amount", "").strip()
+        if not amount_str:
+            raise ValueError("Missing amount")
+
+        amount = self.parse_amount(amount_str)
+        if amount is None:
+            raise ValueError(f"Invalid amount '{amount_str}'")
+
+        # Parse category
+        category = row.get("category", "").strip()
+        if not category:
+            # For BoursoBank, use a default category if none provided
+            if not self.is_boursobank_format:
+                raise ValueError("Missing category")
+            category = "Other"
+        category = self.normalize_category(category)
+
+        # Parse type (optional)
+        trans_type = row.get("type", default_type).strip().lower()
+        if trans_type not in ["personal", "investment"]:
+            trans_type = default_type
+            if trans_type not in ["personal", "investment"]:
+                raise ValueError(f"Invalid type '{trans_type}'")
+
+        # Parse description (optional)
+        description = row.get("description", "").strip()
+
+        return date, amount, category, trans_type, description
+
+    def prepare_import(
+        self,
+        file_path: str,
+        skip_duplicates: bool = True,
+        existing_transactions: Optional[set] = None,
+    ) -> set:
+        """
+        Validate a CSV file and collect existing transactions for duplicate checks.
+
+        Args:
+            file_path: Path to CSV file
+            skip_duplicates: Whether duplicate transactions will be skipped
+            existing_transactions: Keys from a previous file of the same
+                import, reused instead of querying the database again
+
+        Returns:
+            Set of (date, amount, category) keys already in the database,
+            empty when duplicates are not skipped
+
+        Raises:
+            CSVImportError: If the file fails validation
+        """
+        # Validate file first, unless it was validated and has not changed since
+        if not self._restore_validation(file_path):
+            is_valid, error_msg = self.validate_csv_file(file_path)
+            if not is_valid:
+                logger.error(f"CSV validation failed: {error_msg}")
+                raise CSVImportError(error_msg)
+
+        if existing_transactions is not None:
+            return existing_transactions
+
+        # Track existing transactions to detect duplicates; keys are loaded in
+        # one query, so each row is then checked with a set lookup
+        if not skip_duplicates:
+            return set()
+        return self.db_manager.get_transaction_keys()
+
+    def import_batch(
+        self,
+        rows: List[Tuple[int, Dict[str, str]]],
+        skip_duplicates: bool = True,
+        default_type: str = "personal",
+        existing_transactions: Optional[set] = None,
+    ) -> Tuple[int, int, List[str]]:
+        """
+        Import a batch of CSV rows in a single database transaction.
+
+        Args:
+            rows: (row_number, row) tuples as yielded by iter_batches
+            skip_duplicates: Whether to skip duplicate transactions
+            default_type: Default transaction type if not specified
+            existing_transactions: Keys from prepare_import, updated in place
+                with the rows imported from this batch
+
+        Returns:
+            Tuple of (successful_imports, failed_imports, error_messages)
+        """
+        if existing_transactions is None:
+            existing_transactions = set()
+
+        failed = 0
+        errors = []
+
+        # Map columns first so the whole batch's dates are parsed in one pass
+        if self.is_boursobank_format:
+            rows = [(row_num, self._map_boursobank_row(row)) for row_num, row in rows]
+        dates = self.parse_dates([self._date_field(row) for _, row in rows])
+
+        new_rows = []
+        new_keys = set()
+
+        for (row_num, row), date in zip(rows, dates):
+            try:
+                date, amount, category, trans_type, description = self._parse_row(
+                    row, default_type, date
+                )
+            except ValueError as e:
+                failed += 1
+                errors.append(f"Row {row_num}: {str(e)}")
+                continue
+            except Exception as e:
+                failed += 1
+                error_msg = f"Row {row_num}: {str(e)}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+                continue
+
+            # Check for duplicates, including earlier rows of this batch
+            key = (date, round(amount, 2), category)
+            if skip_duplicates and (key in existing_transactions or key in new_keys):
+                logger.debug(f"Row {row_num}: Skipping duplicate transaction")
+                failed += 1
+                errors.append(
+                    f"Row {row_num}: Duplicate transaction skipped "
+                    f"({date}, {amount}, {category})"
+                )
+                continue
+
+            new_keys.add(key)
+            new_rows.append((date, amount, category, trans_type, description))
+
+        if new_rows:
+            try:
+                self.db_manager.add_transactions_bulk(new_rows)
+            except (sqlite3.Error, ValueError) as e:
+                failed += len(new_rows)
+                error_msg = f"Rows {rows[0][0]}-{rows[-1][0]}: {str(e)}"
+                errors.append(error_msg)
+                logger.error(error_msg)
+                new_rows = []
+                new_keys = set()
+
+        # Add to existing set to detect duplicates in later batches
+        if skip_duplicates:
+            existing_transactions.update(new_keys)
+
+        successful = len(new_rows)
+        logger.debug(f"CSV batch imported: {successful} successful, {failed} failed")
+        return successful, failed, errors
+
+    def import_batches(
+        self,
+        file_path: str,
+        skip_duplicates: bool = True,
+        default_type: str = "personal",
+        existing_transactions: Optional[set] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Tuple[int, int, List[str]]]:
+        """
+        Import a prepared CSV file one batch at a time.
+
+        Args:
+            file_path: Path to a CSV file that passed prepare_import
+            skip_duplicates: Whether to skip duplicate transactions
+            default_type: Default transaction type if not specified
+            existing_transactions: Keys from prepare_import, updated in place
+            chunk_size: Number of rows committed per transaction
+
+        Yields:
+            Tuple of (successful_imports, failed_imports, error_messages)
+            for each committed batch
+        """
+        for batch in self.iter_batches(file_path, chunk_size):
+            yield self.import_batch(
+                batch, skip_duplicates, default_type, existing_transactions
+            )
+
     def import_from_csv(
         self,
         file_path: str,
         skip_duplicates: bool = True,
         default_type: str = "personal",
+        chunk_size: int = 1000,
     ) -> Tuple[int, int, List[str]]:
         """
         Import transactions from CSV file.
@@ -224,189 +617,30 @@ class CSVImporter:
             file_path: Path to CSV file
             skip_duplicates: Whether to skip duplicate transactions
             default_type: Default transaction type if not specified
+            chunk_size: Number of rows committed per transaction
 
         Returns:
             Tuple of (successful_imports, failed_imports, error_messages)
         """
         logger.info(f"Starting CSV import from: {file_path}")
 
-        # Validate file first
-        is_valid, error_msg = self.validate_csv_file(file_path)
-        if not is_valid:
-            logger.error(f"CSV validation failed: {error_msg}")
-            raise CSVImportError(error_msg)
+        existing_transactions = self.prepare_import(file_path, skip_duplicates)
 
         successful = 0
         failed = 0
         errors = []
 
-        # Track existing transactions to detect duplicates
-        existing_transactions = set()
-        if skip_duplicates:
-            all_transactions = self.db_manager.get_all_transactions()
-            for trans in all_transactions:
-                # Create a tuple of key fields for comparison
-                key = (trans["date"], trans["amount"], trans["category"])
-                existing_transactions.add(key)
-
         try:
-            with open(file_path, "r", encoding="utf-8-sig") as f:
-                # Use appropriate delimiter based on format detection
-                delimiter = ";" if self.is_boursobank_format else ","
-                reader = csv.DictReader(f, delimiter=delimiter)
-
-                # Normalize headers
-                reader.fieldnames = [h.lower().strip() for h in reader.fieldnames]
-
-                for row_num, row in enumerate(
-                    reader, start=2
-                ):  # Start at 2 (1 is header)
-                    try:
-                        # Handle BoursoBank format mapping
-                        if self.is_boursobank_format:
-                            # Map BoursoBank columns to standard format
-                            mapped_row = {}
-                            for key, value in row.items():
-                                # Map BoursoBank column names to standard names
-                                if key in self.BOURSO_BANK_MAPPING:
-                                    mapped_key = self.BOURSO_BANK_MAPPING[key]
-                                    mapped_row[mapped_key] = value
-                                else:
-                                    mapped_row[key] = value
-
-                            # For BoursoBank, use dateOp first, then dateVal as fallback
-                            if not mapped_row.get("date"):
-                                mapped_row["date"] = row.get("dateval", "")
-
-                            # Combine label and comment for description
-                            label = row.get("label", "").strip()
-                            comment = row.get("comment", "").strip()
-                            if label and comment:
-                                mapped_row["description"] = f"{label} - {comment}"
-                            elif label:
-                                mapped_row["description"] = label
-                            elif comment:
-                                mapped_row["description"] = comment
-
-                            # Map BoursoBank categories to standard categories
-                            category = row.get("category", "").strip()
-                            if category:
-                                # Map common BoursoBank categories to standard ones
-                                category_mapping = {
-                                    "Alimentation": "Food",
-                                    "Transports longue distance (avions, trains…)": "Transport",
-                                    "Virements reçus": "Income",
-                                    "Virements émis": "Transfer",
-                                    "Téléphonie (fixe et mobile)": "Utilities",
-                                    "Restaurants, bars, discothèques…": "Entertainment",
-                                    "Laverie, Pressing …": "Household",
-                                    "Pharmacie et laboratoire": "Healthcare",
-                                    "Vêtements et accessoires": "Shopping",
-                                    "Energie (électricité, gaz, fuel, chauffage…)": "Utilities",
-                                    "Impôts & Taxes - Autres": "Taxes",
-                                    "Allocations familiales": "Income",
-                                    "Dépôts (cartes/chèques/espèces)": "Income",
-                                    "Péages": "Transport",
-                                    "Carburant": "Transport",
-                                    "Hébergement (hôtels, camping…)": "Travel",
-                                    "Equipements sportifs et artistiques": "Sports",
-                                    "Dons et Cadeaux": "Charity",
-                                    "Logement - Autres": "Housing",
-                                    "Revenus épargne financière (retraite, prévoyance, PEA, assurance-vie…)": "Investment",
-                                    "Vie Quotidienne - Autres": "Other",
-                                }
-                                mapped_row["category"] = category_mapping.get(
-                                    category, category
-                                )
-
-                            row = mapped_row
-
-                        # Parse date
-                        date_str = row.get("date", "").strip()
-                        if not date_str:
-                            errors.append(f"Row {row_num}: Missing date")
-                            failed += 1
-                            continue
-
-                        date = self.parse_date(date_str)
-                        if not date:
-                            errors.append(
-                                f"Row {row_num}: Invalid date format '{date_str}'. "
-                                f"Expected formats: YYYY-MM-DD, DD/MM/YYYY, etc."
-                            )
-                            failed += 1
-                            continue
-
-                        # Parse amount
-                        amount_str = row.get("amount", "").strip()
-                        if not amount_str:
-                            errors.append(f"Row {row_num}: Missing amount")
-                            failed += 1
-                            continue
-
-                        amount = self.parse_amount(amount_str)
-                        if amount is None:
-                            errors.append(
-                                f"Row {row_num}: Invalid amount '{amount_str}'"
-                            )
-                            failed += 1
-                            continue
-
-                        # Parse category
-                        category = row.get("category", "").strip()
-                        if not category:
-                            # For BoursoBank, use a default category if none provided
-                            if self.is_boursobank_format:
-                                category = "Other"
-                            else:
-                                errors.append(f"Row {row_num}: Missing category")
-                                failed += 1
-                                continue
-                        category = self.normalize_category(category)
-
-                        # Parse type (optional)
-                        trans_type = row.get("type", default_type).strip().lower()
-                        if trans_type not in ["personal", "investment"]:
-                            trans_type = default_type
-
-                        # Parse description (optional)
-                        description = row.get("description", "").strip()
-
-                        # Check for duplicates
-                        if skip_duplicates:
-                            key = (date, amount, category)
-                            if key in existing_transactions:
-                                logger.debug(
-                                    f"Row {row_num}: Skipping duplicate transaction"
-                                )
-                                failed += 1
-                                errors.append(
-                                    f"Row {row_num}: Duplicate transaction skipped "
-                                    f"({date}, {amount}, {category})"
-                                )
-                                continue
-
-                        # Add transaction to database
-                        self.db_manager.add_transaction(
-                            date=date,
-                            amount=amount,
-                            category=category,
-                            transaction_type=trans_type,
-                            description=description,
-                        )
-
-                        # Add to existing set to detect duplicates within the file
-                        if skip_duplicates:
-                            existing_transactions.add((date, amount, category))
-
-                        successful += 1
-                        logger.debug(f"Row {row_num}: Successfully imported")
-
-                    except Exception as e:
-                        failed += 1
-                        error_msg = f"Row {row_num}: {str(e)}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
+            for batch_successful, batch_failed, batch_errors in self.import_batches(
+                file_path,
+                skip_duplicates,
+                default_type,
+                existing_transactions,
+                chunk_size,
+            ):
+                successful += batch_successful
+                failed += batch_failed
+                errors.extend(batch_errors)
 
         except Exception as e:
             logger.error(f"CSV import error: {str(e)}")
@@ -463,7 +697,11 @@ class CSVImporter:
         logger.info(f"Sample CSV generated at: {output_path}")
 
     def get_import_summary(
-        self, successful: int, failed: int, errors: List[str]
+        self,
+        successful: int,
+        failed: int,
+        errors: List[str],
+        suppressed_errors: int = 0,
     ) -> str:
         """
         Generate a human-readable summary of the import results.
@@ -472,6 +710,7 @@ class CSVImporter:
             successful: Number of successful imports
             failed: Number of failed imports
             errors: List of error messages
+            suppressed_errors: Number of further errors not included in errors
 
         Returns:
             Formatted summary string
@@ -485,7 +724,8 @@ class CSVImporter:
             # Show first 10 errors
             for error in errors[:10]:
                 summary += f"  • {error}\n"
-            if len(errors) > 10:
-                summary += f"  ... and {len(errors) - 10} more errors\n"
+            more_errors = max(0, len(errors) - 10) + suppressed_errors
+            if more_errors:
+                summary += f"  ... and {more_errors} more errors\n"
 
         return summary
@@ -167,6 +167,9 @@ class TickerSuggestions:
     def __init__(self):
         """Initialize ticker suggestions."""
         self._all_tickers: Dict[str, Tuple[str, str]] = {}
+        self._formatted: Dict[str, str] = {}
+        self._info: Dict[str, Tuple[str, str, str]] = {}
+        self._formatted_by_type: Dict[str, List[str]] = {}
         self._load_data()
 
     def _load_data(self):
@@ -175,6 +178,23 @@ class TickerSuggestions:
         self._all_tickers.update(CAC40_STOCKS)
         self._all_tickers.update(TOP_CRYPTO)
 
+        # Format every suggestion once, grouped by asset type in ticker order
+        self._formatted_by_type = {"all": [], "crypto": [], "stock": []}
+        for ticker in self.get_all_tickers():
+            name, category = self._all_tickers[ticker]
+            formatted = self.format_suggestion(ticker, name, category)
+            self._formatted[ticker] = formatted
+            self._formatted_by_type["all"].append(formatted)
+            self._formatted_by_type[self.get_asset_type(ticker)].append(formatted)
+            self._info[ticker] = (ticker, name, category)
+
+        # Also resolve French stocks written with or without the .PA suffix;
+        # exact tickers take precedence over these aliases
+        for ticker, info in list(self._info.items()):
+            self._info.setdefault(f"{ticker}.PA", info)
+            if ticker.endswith(".PA"):
+                self._info.setdefault(ticker[:-3], info)
+
     def get_all_tickers(self) -> List[str]:
         """
         Get list of all ticker symbols.
@@ -195,27 +215,7 @@ class TickerSuggestions:
             Tuple of (ticker, name, category/sector)
         """
         ticker_upper = ticker.upper()
-
-        # Direct match
-        if ticker_upper in self._all_tickers:
-            name, category = self._all_tickers[ticker_upper]
-            return (ticker_upper, name, category)
-
-        # Try adding .PA suffix for French stocks
-        if not ticker_upper.endswith(".PA"):
-            ticker_with_pa = f"{ticker_upper}.PA"
-            if ticker_with_pa in self._all_tickers:
-                name, category = self._all_tickers[ticker_with_pa]
-                return (ticker_with_pa, name, category)
-
-        # Try removing .PA suffix
-        if ticker_upper.endswith(".PA"):
-            ticker_without_pa = ticker_upper[:-3]
-            if ticker_without_pa in self._all_tickers:
-                name, category = self._all_tickers[ticker_without_pa]
-                return (ticker_without_pa, name, category)
-
-        return (ticker_upper, "Unknown", "Unknown")
+        return self._info.get(ticker_upper, (ticker_upper, "Unknown", "Unknown"))
 
     def get_suggestions(self, query: str) -> List[Tuple[str, str, str]]:
         """
@@ -267,6 +267,18 @@ class TickerSuggestions:
         """
         return f"{ticker} - {name} ({category})"
 
+    def get_formatted_list(self, asset_type: str = "all") -> List[str]:
+        """
+        Get every formatted suggestion for an asset type.
+
+        Args:
+            asset_type: "crypto" or "stock"; anything else returns all
+
+        Returns:
+            Shared list of formatted suggestion strings in ticker order
+        """
+        return self._formatted_by_type.get(asset_type, self._formatted_by_type["all"])
+
     def get_formatted_suggestions(self, query: str) -> List[str]:
         """
         Get formatted ticker suggestions.
@@ -278,7 +290,7 @@ class TickerSuggestions:
             List of formatted suggestion strings
         """
         suggestions = self.get_suggestions(query)
-        return [self.format_suggestion(t, n, c) for t, n, c in suggestions]
+        return [self._formatted[t] for t, _, _ in suggestions]
 
     def extract_ticker_from_suggestion(self, suggestion: str) -> str:
         """
@@ -0,0 +1,192 @@
+"""
+Unit tests for category manager operations.
+Tests category lookups and aggregated budget queries.
+"""
+
+import pytest
+import sqlite3
+from pathlib import Path
+import tempfile
+
+from prism.database.db_manager import DatabaseManager
+from prism.database.schema import initialize_database
+from prism.utils.category_manager import CategoryManager
+
+
+@pytest.fixture
+def test_db():
+    """Create a temporary test database."""
+    # Create temporary file
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    db_path = Path(temp_file.name)
+    temp_file.close()
+
+    # Initialize database
+    initialize_database(db_path)
+
+    # Create database manager
+    db = DatabaseManager(db_path)
+
+    yield db
+
+    # Cleanup
+    db.close()
+    db_path.unlink()
+
+
+@pytest.fixture
+def category_manager(test_db):
+    """Create a category manager bound to the test database."""
+    return CategoryManager(test_db)
+
+
+class TestCategoryCreation:
+    """Test category creation."""
+
+    def test_add_duplicate_category_raises(self, category_manager):
+        """Test that the UNIQUE constraint rejects duplicate names."""
+        category_manager.add_category(name="Gifts", category_type="expense")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            category_manager.add_category(name="Gifts", category_type="expense")
+
+    def test_duplicate_category_releases_write_lock(self, test_db, category_manager):
+        """Test that a rejected duplicate does not block other connections."""
+        category_manager.add_category(name="Gifts", category_type="expense")
+
+        with pytest.raises(sqlite3.IntegrityError):
+            category_manager.add_category(name="Gifts", category_type="expense")
+
+        assert not test_db.conn.in_transaction
+
+        # add_transaction writes through its own connection
+        transaction_id = test_db.add_transaction(
+            date="2024-01-15",
+            amount=-20.0,
+            category="Gifts",
+            transaction_type="personal",
+        )
+        assert test_db.get_transaction(transaction_id) is not None
+
+
+class TestCategoryColumns:
+    """Test the columnar category listing."""
+
+    def test_columns_match_all_categories(self, category_manager):
+        """Test that column lists mirror get_all_categories row for row."""
+        for category_type in (None, "income", "expense"):
+            categories = category_manager.get_all_categories(category_type)
+            columns = category_manager.get_category_columns(category_type)
+
+            for key in ("id", "name", "type", "color", "icon", "budget_limit"):
+                assert columns[key] == [c[key] for c in categories]
+
+    def test_columns_include_in_use(self, test_db, category_manager):
+        """Test that the derived in-use column matches the per-category check."""
+        test_db.add_transaction(
+            date="2024-01-15",
+            amount=-50.0,
+            category="Food",
+            transaction_type="personal",
+        )
+
+        columns = category_manager.get_category_columns(include_in_use=True)
+
+        assert columns["in_use"] == [
+            category_manager._is_category_in_use(category_id)
+            for category_id in columns["id"]
+        ]
+        assert sum(columns["in_use"]) == 1
+
+    def test_columns_empty_database(self, test_db, category_manager):
+        """Test that an empty table yields empty column lists."""
+        test_db.conn.execute("DELETE FROM categories")
+        test_db.conn.commit()
+
+        columns = category_manager.get_category_columns()
+        assert columns["id"] == []
+        assert columns["name"] == []
+
+
+class TestBudgetAggregates:
+    """Test aggregated budget queries."""
+
+    def test_get_monthly_totals(self, test_db, category_manager):
+        """Test per-category totals within a date range."""
+        test_db.add_transaction(
+            date="2024-01-15",
+            amount=-50.0,
+            category="Food",
+            transaction_type="personal",
+        )
+        test_db.add_transaction(
+            date="2024-01-20",
+            amount=-25.0,
+            category="Food",
+            transaction_type="personal",
+        )
+        test_db.add_transaction(
+            date="2024-02-01",
+            amount=-100.0,
+            category="Food",
+            transaction_type="personal",
+        )
+        test_db.add_transaction(
+            date="2024-01-10",
+            amount=3000.0,
+            category="Salary",
+            transaction_type="personal",
+        )
+
+        totals = category_manager.get_monthly_totals("2024-01-01", "2024-01-31")
+        assert totals == {"Food": -75.0}
+
+        income = category_manager.get_monthly_totals(
+            "2024-01-01", "2024-01-31", category_type="income"
+        )
+        assert income == {"Salary": 3000.0}
+
+    def test_monthly_totals_match_category_statistics(self, test_db, category_manager):
+        """Test that the aggregate agrees with get_category_statistics."""
+        test_db.add_transaction(
+            date="2024-01-15",
+            amount=-12.5,
+            category="Transport",
+            transaction_type="personal",
+        )
+        test_db.add_transaction(
+            date="2024-01-16",
+            amount=-7.5,
+            category="Transport",
+            transaction_type="personal",
+        )
+
+        totals = category_manager.get_monthly_totals("2024-01-01", "2024-01-31")
+        stats = category_manager.get_category_statistics(
+            "Transport", "2024-01-01", "2024-01-31"
+        )
+        assert totals["Transport"] == stats["total_amount"]
+
+
+class TestDataVersion:
+    """Test the database change token."""
+
+    def test_data_version_changes_on_write(self, test_db, category_manager):
+        """Test that writes through either connection change the token."""
+        initial = category_manager.get_data_version()
+        assert category_manager.get_data_version() == initial
+
+        # Write through a separate connection
+        test_db.add_transaction(
+            date="2024-01-15",
+            amount=-50.0,
+            category="Food",
+            transaction_type="personal",
+        )
+        after_transaction = category_manager.get_data_version()
+        assert after_transaction != initial
+
+        # Write through the shared connection
+        food = category_manager.get_category_by_name("Food")
+        category_manager.update_category(food["id"], budget_limit=200.0)
+        assert category_manager.get_data_version() != after_transaction
@@ -0,0 +1,255 @@
+"""
+Unit tests for CSV transaction imports.
+Tests batched imports, duplicate detection and row validation.
+"""
+
+import pytest
+import subprocess
+import sys
+from pathlib import Path
+import tempfile
+
+from prism.database.db_manager import DatabaseManager
+from prism.database.schema import initialize_database
+from prism.utils.csv_import import CSVImporter, CSVImportError
+
+
+@pytest.fixture
+def test_db():
+    """Create a temporary test database."""
+    # Create temporary file
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+    db_path = Path(temp_file.name)
+    temp_file.close()
+
+    # Initialize database
+    initialize_database(db_path)
+
+    # Create database manager
+    db = DatabaseManager(db_path)
+
+    yield db
+
+    # Cleanup
+    db.close()
+    db_path.unlink()
+
+
+@pytest.fixture
+def importer(test_db):
+    """Create a CSV importer bound to the test database."""
+    return CSVImporter(test_db)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Write CSV content to a temporary file and return its path."""
+
+    def _write(content: str) -> str:
+        path = tmp_path / "import.csv"
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    return _write
+
+
+class TestCSVImport:
+    """Test importing transactions from CSV files."""
+
+    def test_import_sample_csv(self, test_db, importer, tmp_path):
+        """Test that the generated sample imports completely."""
+        path = str(tmp_path / "sample.csv")
+        importer.generate_sample_csv(path)
+
+        successful, failed, errors = importer.import_from_csv(path)
+
+        assert (successful, failed, errors) == (4, 0, [])
+        assert len(test_db.get_all_transactions()) == 4
+
+    def test_import_across_batches(self, test_db, importer, csv_file):
+        """Test that small batches import every row and keep row numbers."""
+        lines = ["date,amount,category"]
+        lines += [f"2024-01-{day:02d},-{day}.50,Food" for day in range(1, 8)]
+        lines.append("not-a-date,-1.00,Food")
+        path = csv_file("\n".join(lines) + "\n")
+
+        successful, failed, errors = importer.import_from_csv(path, chunk_size=3)
+
+        assert successful == 7
+        assert failed == 1
+        assert errors[0].startswith("Row 9: Invalid date format")
+        assert len(test_db.get_all_transactions()) == 7
+
+    def test_skip_duplicates_across_batches(self, test_db, importer, csv_file):
+        """Test duplicates are skipped against the database and the file."""
+        test_db.add_transaction(
+            date="2024-01-15",
+            amount=-45.5,
+            category="Food",
+            transaction_type="personal",
+        )
+        path = csv_file(
+            "date,amount,category\n"
+            "2024-01-15,-45.50,Food\n"
+            "2024-01-16,-10.00,Food\n"
+            "2024-01-16,-10.00,Food\n"
+        )
+
+        successful, failed, errors = importer.import_from_csv(path, chunk_size=2)
+
+        assert (successful, failed) == (1, 2)
+        assert all("Duplicate transaction skipped" in error for error in errors)
+        assert len(test_db.get_all_transactions()) == 2
+
+    def test_keep_duplicates_when_disabled(self, test_db, importer, csv_file):
+        """Test that duplicates are imported when skipping is disabled."""
+        path = csv_file(
+            "date,amount,category\n"
+            "2024-01-16,-10.00,Food\n"
+            "2024-01-16,-10.00,Food\n"
+        )
+
+        successful, failed, _ = importer.import_from_csv(path, skip_duplicates=False)
+
+        assert (successful, failed) == (2, 0)
+
+    def test_invalid_rows_are_reported(self, importer, csv_file):
+        """Test that missing or invalid fields are reported per row."""
+        path = csv_file(
+            "date,amount,category,type\n"
+            ",-1.00,Food,personal\n"
+            "2024-01-15,abc,Food,personal\n"
+            "2024-01-15,-1.00,,personal\n"
+            "15/01/2024,(12.00),food,unknown\n"
+        )
+
+        successful, failed, errors = importer.import_from_csv(path)
+
+        assert (successful, failed) == (1, 3)
+        assert errors == [
+            "Row 2: Missing date",
+            "Row 3: Invalid amount 'abc'",
+            "Row 4: Missing category",
+        ]
+
+    def test_invalid_default_type_fails_per_row(self, test_db, importer, csv_file):
+        """Test that an invalid type only fails the rows that fall back to it."""
+        path = csv_file(
+            "date,amount,category,type\n"
+            "2024-01-15,-1.00,Food,personal\n"
+            "2024-01-16,-2.00,Food,\n"
+        )
+
+        successful, failed, errors = importer.import_from_csv(
+            path, default_type="invalid"
+        )
+
+        assert (successful, failed) == (1, 1)
+        assert errors == ["Row 3: Invalid type 'invalid'"]
+        assert len(test_db.get_all_transactions()) == 1
+
+    def test_dedup_index_rounds_amounts(self, test_db, importer, csv_file):
+        """Test that stored amounts with float noise still match."""
+        test_db.add_transaction(
+            date="2024-01-15",
+            amount=0.1 + 0.2,
+            category="Food",
+            transaction_type="personal",
+        )
+
+        path = csv_file("date,amount,category\n2024-01-15,0.30,Food\n")
+        successful, failed, _ = importer.import_from_csv(path)
+
+        assert (successful, failed) == (0, 1)
+
+    def test_format_detected_per_file(self, importer, tmp_path):
+        """Test that a standard file imports after a BoursoBank file."""
+        bourso = tmp_path / "bourso.csv"
+        bourso.write_text(
+            "dateOp;dateVal;label;category;amount\n"
+            '2024-01-15;2024-01-15;"CARTE";"Alimentation";"-45,50"\n',
+            encoding="utf-8",
+        )
+        standard = tmp_path / "standard.csv"
+        standard.write_text("date,amount,category\n2024-01-16,-10.00,Food\n")
+
+        assert importer.import_from_csv(str(bourso))[:2] == (1, 0)
+        assert importer.import_from_csv(str(standard))[:2] == (1, 0)
+        assert importer.is_boursobank_format is False
+
+
+class TestDateParsing:
+    """Test batch date parsing."""
+
+    def test_parse_dates_matches_parse_date(self, importer):
+        """Test that vectorized parsing agrees with the per-value parser."""
+        values = [
+            "2024-01-15",
+            "2024-1-5",
+            "15/01/2024",
+            "01/15/2024",
+            "2024/02/29",
+            "31-12-2024",
+            "12-31-2024",
+            " 2024-01-15 ",
+            "2023-02-29",
+            "not-a-date",
+            "",
+        ]
+
+        assert importer.parse_dates(values) == [
+            importer.parse_date(value) for value in values
+        ]
+
+    def test_parse_dates_empty(self, importer):
+        """Test that an empty batch parses to an empty list."""
+        assert importer.parse_dates([]) == []
+
+
+class TestValidationCache:
+    """Test reuse of file validation between selection and import."""
+
+    def test_import_reuses_validation(self, importer, csv_file, monkeypatch):
+        """Test that an unchanged validated file is not validated again."""
+        path = csv_file("date,amount,category\n2024-01-16,-10.00,Food\n")
+        assert importer.validate_csv_file(path) == (True, "")
+
+        calls = []
+        original = importer.validate_csv_file
+        monkeypatch.setattr(
+            importer,
+            "validate_csv_file",
+            lambda file_path: calls.append(file_path) or original(file_path),
+        )
+
+        assert importer.import_from_csv(path)[:2] == (1, 0)
+        assert calls == []
+
+    def test_changed_file_is_validated_again(self, importer, csv_file):
+        """Test that a file edited after validation is checked again."""
+        path = csv_file("date,amount,category\n2024-01-16,-10.00,Food\n")
+        assert importer.validate_csv_file(path) == (True, "")
+
+        Path(path).write_text("date,amount\n2024-01-16,-10.00\n")
+
+        with pytest.raises(CSVImportError, match="Missing required columns"):
+            importer.import_from_csv(path)
+
+
+class TestLazyImports:
+    """Test that heavy dependencies stay out of module import time."""
+
+    def test_pandas_not_imported_eagerly(self):
+        """Test that importing the CSV importer does not load pandas."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, prism.utils.csv_import; print('pandas' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "False"
@@ -8,14 +8,9 @@ import sqlite3
 from pathlib import Path
 from datetime import datetime
 import tempfile
-import sys
 
-# Add src to path
-src_path = Path(__file__).parent.parent / "prism"
-sys.path.insert(0, str(src_path))
-
-from database.db_manager import DatabaseManager
-from database.schema import initialize_database
+from prism.database.db_manager import DatabaseManager
+from prism.database.schema import initialize_database
 
 
 @pytest.fixture
@@ -60,6 +55,41 @@ class TestTransactions:
         assert transaction["category"] == "Food"
         assert transaction["type"] == "personal"
 
+    def test_add_transactions_bulk(self, test_db):
+        """Test adding several transactions at once."""
+        added = test_db.add_transactions_bulk(
+            [
+                ("2024-01-15", -50.0, "Food", "personal", "Groceries"),
+                ("2024-01-16", 3000.0, "Salary", "personal", None),
+                ("2024-01-17", -200.0, "Stocks", "investment", ""),
+            ]
+        )
+
+        assert added == 3
+        assert len(test_db.get_all_transactions()) == 3
+        assert test_db.add_transactions_bulk([]) == 0
+
+        # One invalid row rejects the whole batch before anything is written
+        with pytest.raises(ValueError):
+            test_db.add_transactions_bulk(
+                [
+                    ("2024-01-18", -10.0, "Food", "personal", None),
+                    ("2024-01-18", -20.0, "Food", "invalid", None),
+                ]
+            )
+        assert len(test_db.get_all_transactions()) == 3
+
+    def test_get_transaction_keys(self, test_db):
+        """Test that duplicate-detection keys round amounts to cents."""
+        test_db.add_transaction(
+            date="2024-01-15",
+            amount=0.1 + 0.2,
+            category="Food",
+            transaction_type="personal",
+        )
+
+        assert test_db.get_transaction_keys() == {("2024-01-15", 0.3, "Food")}
+
     def test_get_all_transactions(self, test_db):
         """Test getting all transactions."""
         # Add multiple transactions
@@ -255,6 +285,29 @@ class TestAssets:
         assets = test_db.get_all_assets()
         assert len(assets) == 2
 
+    def test_get_all_assets_ordered_by_value(self, test_db):
+        """Test ordering assets by current value across pages."""
+        for ticker, quantity, current_price in [
+            ("AAA", 1.0, 10.0),
+            ("BBB", 2.0, 100.0),
+            ("CCC", 5.0, None),
+            ("DDD", 1.0, 500.0),
+        ]:
+            test_db.add_asset(
+                ticker=ticker,
+                quantity=quantity,
+                price_buy=1.0,
+                date_buy="2024-01-15",
+                asset_type="stock",
+                current_price=current_price,
+            )
+
+        assets = test_db.get_all_assets(order_by_value=True)
+        assert [a["ticker"] for a in assets] == ["DDD", "BBB", "AAA", "CCC"]
+
+        page = test_db.get_all_assets(limit=2, offset=1, order_by_value=True)
+        assert [a["ticker"] for a in page] == ["BBB", "AAA"]
+
     def test_filter_assets_by_type(self, test_db):
         """Test filtering assets by type."""
         test_db.add_asset(
@@ -312,6 +365,141 @@ class TestAssets:
         asset = test_db.get_asset(asset_id)
         assert asset["current_price"] == 55000.0
 
+    def test_update_asset_prices(self, test_db):
+        """Test updating several asset prices at once."""
+        btc_id = test_db.add_asset(
+            ticker="BTC",
+            quantity=0.5,
+            price_buy=50000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+        eth_id = test_db.add_asset(
+            ticker="ETH",
+            quantity=2.0,
+            price_buy=3000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+
+        updated = test_db.update_asset_prices([(btc_id, 55000.0), (eth_id, 3200.0)])
+        assert updated == 2
+
+        assert test_db.get_asset(btc_id)["current_price"] == 55000.0
+        assert test_db.get_asset(eth_id)["current_price"] == 3200.0
+        assert test_db.update_asset_prices([]) == 0
+
+    def test_add_historical_prices_bulk(self, test_db):
+        """Test adding historical prices for several assets at once."""
+        btc_id = test_db.add_asset(
+            ticker="BTC",
+            quantity=0.5,
+            price_buy=50000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+        eth_id = test_db.add_asset(
+            ticker="ETH",
+            quantity=2.0,
+            price_buy=3000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+
+        test_db.add_historical_prices_bulk(
+            [
+                (btc_id, "2024-01-01", 42000.0),
+                (btc_id, "2024-01-02", 43000.0),
+                (eth_id, "2024-01-01", 2300.0),
+            ]
+        )
+
+        btc_prices = test_db.get_historical_prices(btc_id)
+        assert [(p["date"], p["price"]) for p in btc_prices] == [
+            ("2024-01-01", 42000.0),
+            ("2024-01-02", 43000.0),
+        ]
+        assert len(test_db.get_historical_prices(eth_id)) == 1
+        assert test_db.get_last_historical_price_date(btc_id) == "2024-01-02"
+
+        # A date that is already stored is replaced, not duplicated
+        test_db.add_historical_prices_bulk([(btc_id, "2024-01-02", 43500.0)])
+        btc_prices = test_db.get_historical_prices(btc_id)
+        assert len(btc_prices) == 2
+        assert btc_prices[-1]["price"] == 43500.0
+
+    def test_add_historical_prices_bulk_empty(self, test_db):
+        """Test that saving no historical prices is a no-op."""
+        asset_id = test_db.add_asset(
+            ticker="BTC",
+            quantity=0.5,
+            price_buy=50000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+
+        test_db.add_historical_prices_bulk([])
+
+        assert test_db.get_historical_prices(asset_id) == []
+        assert test_db.get_last_historical_price_date(asset_id) is None
+
+    def test_get_last_historical_price_dates(self, test_db):
+        """Test looking up the latest historical date of several assets."""
+        btc_id = test_db.add_asset(
+            ticker="BTC",
+            quantity=0.5,
+            price_buy=50000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+        eth_id = test_db.add_asset(
+            ticker="ETH",
+            quantity=2.0,
+            price_buy=3000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+        sol_id = test_db.add_asset(
+            ticker="SOL",
+            quantity=10.0,
+            price_buy=100.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+
+        # Several dates per asset, not stored in date order
+        test_db.add_historical_prices_bulk(
+            [
+                (btc_id, "2024-01-03", 44000.0),
+                (btc_id, "2024-01-01", 42000.0),
+                (btc_id, "2024-01-02", 43000.0),
+                (eth_id, "2024-01-02", 2400.0),
+                (eth_id, "2024-01-01", 2300.0),
+            ]
+        )
+
+        last_dates = test_db.get_last_historical_price_dates([btc_id, eth_id, sol_id])
+
+        # SOL has no historical prices, so it is left out
+        assert last_dates == {btc_id: "2024-01-03", eth_id: "2024-01-02"}
+        for asset_id in (btc_id, eth_id, sol_id):
+            assert last_dates.get(asset_id) == (
+                test_db.get_last_historical_price_date(asset_id)
+            )
+
+    def test_get_last_historical_price_dates_no_rows(self, test_db):
+        """Test the lookup when there are no historical prices at all."""
+        asset_id = test_db.add_asset(
+            ticker="BTC",
+            quantity=0.5,
+            price_buy=50000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+        )
+
+        assert test_db.get_last_historical_price_dates([asset_id]) == {}
+        assert test_db.get_last_historical_price_dates([]) == {}
+
     def test_delete_asset(self, test_db):
         """Test deleting an asset."""
         asset_id = test_db.add_asset(
@@ -377,6 +565,38 @@ class TestAssets:
         assert "allocation" in summary
         assert len(summary["allocation"]) == 2
 
+    def test_get_portfolio_snapshot(self, test_db):
+        """Test portfolio snapshot matches the separate queries."""
+        assert test_db.get_portfolio_snapshot() == {
+            "total_value": 0.0,
+            "total_cost": 0.0,
+            "total_gain": 0.0,
+            "asset_count": 0,
+        }
+
+        test_db.add_asset(
+            ticker="BTC",
+            quantity=0.5,
+            price_buy=50000.0,
+            date_buy="2024-01-15",
+            asset_type="crypto",
+            current_price=52000.0,
+        )
+        test_db.add_asset(
+            ticker="AAPL",
+            quantity=10.0,
+            price_buy=150.0,
+            date_buy="2024-01-16",
+            asset_type="stock",
+        )
+
+        snapshot = test_db.get_portfolio_snapshot()
+        summary = test_db.get_portfolio_summary()
+        assert snapshot["total_value"] == test_db.get_portfolio_value()
+        assert snapshot["total_cost"] == summary["total_cost"]
+        assert snapshot["total_gain"] == summary["total_gain"]
+        assert snapshot["asset_count"] == test_db.get_asset_count()
+
     def test_get_asset_performance(self, test_db):
         """Test asset performance calculation."""
         asset_id = test_db.add_asset(
@@ -405,7 +625,7 @@ class TestOrders:
             quantity=0.5,
             price=50000.0,
             order_type="buy",
-            date="2024-01-15",
+            order_date="2024-01-15",
             status="open",
         )
 
@@ -425,14 +645,14 @@ class TestOrders:
             quantity=0.5,
             price=50000.0,
             order_type="buy",
-            date="2024-01-15",
+            order_date="2024-01-15",
         )
         test_db.add_order(
             ticker="ETH",
             quantity=2.0,
             price=3000.0,
             order_type="buy",
-            date="2024-01-16",
+            order_date="2024-01-16",
         )
 
         orders = test_db.get_all_orders()
@@ -445,7 +665,7 @@ class TestOrders:
             quantity=0.5,
             price=50000.0,
             order_type="buy",
-            date="2024-01-15",
+            order_date="2024-01-15",
             status="open",
         )
         test_db.add_order(
@@ -453,7 +673,7 @@ class TestOrders:
             quantity=2.0,
             price=3000.0,
             order_type="buy",
-            date="2024-01-16",
+            order_date="2024-01-16",
             status="closed",
         )
 
@@ -468,7 +688,7 @@ class TestOrders:
             quantity=0.5,
             price=50000.0,
             order_type="buy",
-            date="2024-01-15",
+            order_date="2024-01-15",
         )
 
         # Update quantity
@@ -486,7 +706,7 @@ class TestOrders:
             quantity=0.5,
             price=50000.0,
             order_type="buy",
-            date="2024-01-15",
+            order_date="2024-01-15",
             status="open",
         )
 
@@ -505,7 +725,7 @@ class TestOrders:
             quantity=0.5,
             price=50000.0,
             order_type="buy",
-            date="2024-01-15",
+            order_date="2024-01-15",
         )
 
         # Delete
@@ -541,7 +761,7 @@ class TestDatabaseStats:
             quantity=0.5,
             price=50000.0,
             order_type="buy",
-            date="2024-01-15",
+            order_date="2024-01-15",
         )
 
         stats = test_db.get_database_stats()
@@ -582,5 +802,5 @@ class TestValidation:
                 quantity=0.5,
                 price=50000.0,
                 order_type="invalid",
-                date="2024-01-15",
+                order_date="2024-01-15",
             )